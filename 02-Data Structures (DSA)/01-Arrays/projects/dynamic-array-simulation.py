@@ -1,3 +1,353 @@
+import array
+import bisect
+import functools
+import itertools
+import mmap
+import multiprocessing
+import operator
+import os
+import struct
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the bulk operations fall back to pure Python without it
+    np = None
+
+
+class GrowthPolicy:
+    """
+    Decides the new capacity of a dynamic array when it runs out of space.
+
+    Capacity grows geometrically by `factor` (e.g. 2.0 for doubling, 1.5 for a gentler curve). If a
+    `linear_threshold` is given, capacities at or above it grow by a fixed `linear_increment`
+    instead, which bounds the wasted slots of very large arrays.
+
+    Any object with a compatible `grow(capacity, min_capacity)` method can be used as a policy.
+    """
+
+    def __init__(self, factor: float = 2.0, linear_threshold: int = None, linear_increment: int = None):
+        """
+        Initializes the growth policy.
+
+        Args:
+            factor (float): The geometric growth factor. Must be greater than 1. Default is 2.0.
+            linear_threshold (int, optional): Capacity from which growth becomes linear. Default is None.
+            linear_increment (int, optional): Slots added per linear step. Defaults to linear_threshold.
+
+        Raises:
+            ValueError: If the factor is not greater than 1 or the linear increment is not positive.
+        """
+        if factor <= 1:
+            raise ValueError("Growth factor must be greater than 1.")
+        if linear_increment is None:
+            linear_increment = linear_threshold
+        if linear_threshold is not None and linear_increment <= 0:
+            raise ValueError("Linear increment must be positive.")
+        self.factor = factor
+        self.linear_threshold = linear_threshold
+        self.linear_increment = linear_increment
+
+    def grow(self, capacity: int, min_capacity: int) -> int:
+        """
+        Returns the capacity to resize to.
+
+        Args:
+            capacity (int): The current capacity.
+            min_capacity (int): The number of slots that must fit after growing.
+
+        Returns:
+            int: A capacity of at least `min_capacity` and greater than `capacity`.
+        """
+        if self.linear_threshold is not None and capacity >= self.linear_threshold:
+            new_capacity = capacity + self.linear_increment
+        else:
+            new_capacity = int(capacity * self.factor)
+        return max(new_capacity, capacity + 1, min_capacity)
+
+
+class ShrinkPolicy:
+    """
+    Decides when and how far a dynamic array gives memory back after removals.
+
+    When occupancy drops below `threshold`, the capacity is multiplied by `factor` (repeatedly, but
+    applied as a single resize) until occupancy is back above the threshold. The threshold may be
+    at most half the factor (e.g. shrink to 1/2 at 1/4 full). With growth by up to 2x, a shrink
+    then leaves at least (factor - threshold) * capacity free slots before the next grow, and a
+    grow leaves at least half its elements to remove before the next shrink, so alternating
+    appends and removals cannot make every operation resize. For a growth factor g above 2, pick
+    threshold <= factor / g.
+
+    Any object with a compatible `shrink(size, capacity)` method can be used as a policy.
+    """
+
+    def __init__(self, threshold: float = 0.25, factor: float = 0.5, min_capacity: int = 4):
+        """
+        Initializes the shrink policy.
+
+        Args:
+            threshold (float): Occupancy below which the array shrinks. 0 disables shrinking. Default is 0.25.
+            factor (float): Multiplier applied to the capacity on each shrink step. Default is 0.5.
+            min_capacity (int): The capacity is never shrunk below this value. Default is 4.
+
+        Raises:
+            ValueError: If the values do not satisfy 0 <= threshold <= factor / 2 and 0 < factor < 1.
+        """
+        if not (0 <= threshold <= factor / 2 and 0 < factor < 1):
+            raise ValueError("Shrink policy requires 0 <= threshold <= factor / 2 and 0 < factor < 1.")
+        self.threshold = threshold
+        self.factor = factor
+        self.min_capacity = min_capacity
+
+    def shrink(self, size: int, capacity: int):
+        """
+        Returns the capacity to shrink to, or None to keep the current capacity.
+
+        Args:
+            size (int): The number of elements in the array.
+            capacity (int): The current capacity.
+
+        Returns:
+            int | None: The smaller capacity, or None if no shrink is needed.
+        """
+        new_capacity = capacity
+        while size < new_capacity * self.threshold and int(new_capacity * self.factor) >= self.min_capacity:
+            new_capacity = int(new_capacity * self.factor)
+        return new_capacity if new_capacity < capacity else None
+
+
+class ValueIndex:
+    """
+    A hash index from values to their positions in a DynamicArray.
+
+    Each element gets a stable key when it is appended. Removing an element records its key in a
+    sorted list of removed keys instead of renumbering every later element, so the current
+    position of a key is `key - (number of removed keys below it)`, found with one bisect. The
+    removed-key list is folded back in by a full rebuild once it grows past a fraction of the array.
+
+    Memory: a dict entry plus a one-element list per distinct value, roughly 170 bytes per
+    element for mostly unique values on 64-bit CPython. Use DynamicArray.index_memory() to
+    measure the actual figure.
+    """
+
+    def __init__(self, lazy: bool = False):
+        """
+        Initializes an empty (stale) index.
+
+        Args:
+            lazy (bool): If True, mutations only mark the index stale and the next lookup rebuilds
+                it. This suits bulk loads. If False, appends and removals update it in place. Default is False.
+        """
+        self.lazy = lazy
+        self.keys = {}  # value -> ascending list of stable keys
+        self.removed = []  # Sorted keys removed since the last rebuild
+        self.next_key = 0
+        self.stale = True
+
+    def rebuild(self, values):
+        """
+        Rebuilds the index from the live elements, in order.
+
+        Time Complexity: O(n).
+        """
+        keys = {}
+        next_key = 0
+        for next_key, value in enumerate(values, 1):
+            keys.setdefault(value, []).append(next_key - 1)
+        self.keys, self.removed, self.next_key, self.stale = keys, [], next_key, False
+
+    def add(self, value):
+        """
+        Records a value appended at the end of the array.
+
+        Time Complexity: O(1).
+        """
+        self.keys.setdefault(value, []).append(self.next_key)
+        self.next_key += 1
+
+    def _position(self, key: int) -> int:
+        """
+        Converts a stable key into the element's current position.
+
+        Time Complexity: O(log r), where r is the number of keys removed since the last rebuild.
+        """
+        return key - bisect.bisect_left(self.removed, key)
+
+    def find(self, value) -> int:
+        """
+        Returns the position of the first occurrence of a value, or -1 if it is absent.
+
+        Time Complexity: O(log r).
+        """
+        keys = self.keys.get(value)
+        return self._position(keys[0]) if keys else -1
+
+    def discard_first(self, value) -> int:
+        """
+        Forgets the first occurrence of a value and returns the position it had.
+
+        Time Complexity: O(log r + r) for the sorted insert into the removed-key list.
+        """
+        keys = self.keys[value]
+        key = keys.pop(0)
+        if not keys:
+            del self.keys[value]
+        position = self._position(key)
+        bisect.insort(self.removed, key)
+        return position
+
+    def replace(self, position: int, old_value, new_value):
+        """
+        Records that the element at a position changed from old_value to new_value.
+
+        Time Complexity: O(d log r), where d is the number of occurrences of old_value.
+        """
+        keys = self.keys[old_value]
+        for i, key in enumerate(keys):
+            if self._position(key) == position:
+                del keys[i]
+                break
+        if not keys:
+            del self.keys[old_value]
+        bisect.insort(self.keys.setdefault(new_value, []), key)
+
+    def memory_usage(self) -> int:
+        """
+        Returns the approximate number of bytes held by the index (dict, key lists and keys).
+        """
+        total = sys.getsizeof(self.keys) + sys.getsizeof(self.removed)
+        for keys in self.keys.values():
+            total += sys.getsizeof(keys) + sum(sys.getsizeof(key) for key in keys)
+        return total
+
+
+class ResizeStats:
+    """
+    Counters collected by DynamicArray.enable_stats().
+
+    Attributes:
+        grows (int): Resizes that increased the capacity.
+        shrinks (int): Resizes that decreased the capacity.
+        elements_copied (int): Elements moved by all resizes together.
+        peak_capacity (int): The largest capacity reached.
+        peak_size (int): The largest number of elements held.
+        occupancy_histogram (list[int]): Samples of size / capacity in ten 10%-wide bins, taken
+            after every append and every resize.
+    """
+
+    def __init__(self, capacity: int, size: int):
+        """
+        Initializes the counters from the array's current state.
+        """
+        self.grows = 0
+        self.shrinks = 0
+        self.elements_copied = 0
+        self.peak_capacity = capacity
+        self.peak_size = size
+        self.occupancy_histogram = [0] * 10
+
+    def record_resize(self, old_capacity: int, new_capacity: int, copied: int, size: int):
+        """
+        Records one completed resize.
+        """
+        if new_capacity > old_capacity:
+            self.grows += 1
+        elif new_capacity < old_capacity:
+            self.shrinks += 1
+        self.elements_copied += copied
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+        self.sample(size, new_capacity)
+
+    def sample(self, size: int, capacity: int):
+        """
+        Adds one occupancy sample to the histogram.
+        """
+        self.peak_size = max(self.peak_size, size)
+        if capacity:
+            self.occupancy_histogram[min(size * 10 // capacity, 9)] += 1
+
+
+_NUMPY_REDUCERS = {} if np is None else {
+    operator.add: np.add, operator.mul: np.multiply, min: np.minimum, max: np.maximum,
+    operator.and_: np.bitwise_and, operator.or_: np.bitwise_or, operator.xor: np.bitwise_xor,
+}  # Python reducers that DynamicArray.reduce() replaces with the equivalent NumPy ufunc
+
+
+def _check_typecode(typecode: str):
+    """
+    Raises:
+        ValueError: If the typecode is not an array module typecode, or is the deprecated 'u'.
+    """
+    supported = array.typecodes.replace('u', '')
+    if typecode not in tuple(supported):  # A tuple, so that substrings such as 'qQ' do not match
+        raise ValueError(f"Unsupported typecode {typecode!r}. Use one of {supported!r}.")
+
+
+def _check_byteorder(path: str, byteorder: bytes) -> bytes:
+    """
+    Returns the byte order recorded in a saved array's header: b'<' or b'>'. Files written before
+    the order was recorded have a zero byte there and are read in the machine's order.
+
+    Raises:
+        ValueError: If the header holds any other byte.
+    """
+    if byteorder == b"\0":
+        return DynamicArray.FILE_BYTEORDER
+    if byteorder not in (b"<", b">"):
+        raise ValueError(f"{path} records an unknown byte order {byteorder!r}.")
+    return byteorder
+
+
+def _typecode_range(typecode: str):
+    """
+    Returns the (lowest, highest) values an integer typecode can hold.
+    """
+    bits = 8 * array.array(typecode).itemsize
+    return (-(1 << bits - 1), (1 << bits - 1) - 1) if typecode.islower() else (0, (1 << bits) - 1)
+
+
+def _promote_typecodes(first: str, second: str) -> str:
+    """
+    Returns the typecode that NumPy's np.result_type() gives for two typecodes, worked out
+    without NumPy so that the arithmetic operators pick the same typecode on both backends.
+
+    Integers of the same signedness give the wider typecode. A signed and an unsigned integer
+    give the narrowest signed typecode that holds both, or 'd' if none does ('q' and 'Q'). A
+    float gives 'd', except that 'f' stays 'f' with 'f' and with integers of up to 2 bytes.
+    """
+    itemsize = {code: array.array(code).itemsize for code in (first, second)}
+    if first in ('f', 'd') or second in ('f', 'd'):
+        if 'd' in (first, second) or any(code not in ('f', 'd') and itemsize[code] > 2 for code in (first, second)):
+            return 'd'
+        return 'f'
+    if first.islower() == second.islower():
+        return first if itemsize[first] >= itemsize[second] else second
+    signed, unsigned = (first, second) if first.islower() else (second, first)
+    for code in 'bhiq':
+        size = array.array(code).itemsize
+        if size > itemsize[unsigned] and size >= itemsize[signed]:
+            return code
+    return 'd'
+
+
+def _fits_typecode(op, left, right, typecode: str) -> bool:
+    """
+    Checks that adding, subtracting or multiplying an ndarray and an ndarray or Python int cannot
+    leave an integer typecode's range. The results of these operations are extreme where the
+    operands are, so this only needs the operands' minimum and maximum.
+    """
+    if not left.size:
+        return True
+    low, high = _typecode_range(typecode)
+    left_ends = (int(left.min()), int(left.max()))
+    right_ends = (int(right.min()), int(right.max())) if isinstance(right, np.ndarray) else (right,)
+    return all(low <= value <= high for value in right_ends) and \
+        all(low <= op(a, b) <= high for a in left_ends for b in right_ends)
+
+
 class DynamicArray:
     """
     A class to simulate a dynamic array with memory management features.
@@ -5,10 +355,45 @@ class DynamicArray:
 
     Key Features and Improvements:
     - Dynamic Resizing: Automatically resizes when capacity is exceeded, using a doubling strategy for efficiency.
+      The growth and shrink strategies can be replaced with GrowthPolicy / ShrinkPolicy instances.
     - Element Removal: Allows removal of elements while preserving the order of the remaining elements.
     - Access: Provides safe access to elements with bounds checking.
     - Memory Simulation: Simulates memory allocation with None for unused blocks.
     - Debugging Support: Includes a memory layout print function for visualization.
+    - Typed Storage: Passing a typecode (e.g. DynamicArray(typecode='q')) stores raw machine
+      values in an array.array instead of a list of pointers to boxed Python objects.
+
+    Memory per Element:
+    - Untyped (default): 8 bytes for the list slot, plus the object it points to
+      (28 bytes for a small int, 24 bytes for a float on 64-bit CPython).
+    - Typed: exactly `itemsize` bytes per slot, with no per-element object:
+
+        Typecode   C Type               Bytes per Element
+        'b' / 'B'  signed/unsigned char         1
+        'h' / 'H'  signed/unsigned short        2
+        'i' / 'I'  signed/unsigned int          4
+        'l' / 'L'  signed/unsigned long         8 (4 on Windows)
+        'q' / 'Q'  signed/unsigned long long    8
+        'f'        float                        4
+        'd'        double                       8
+
+      The exact figure for the running platform is available as `dyn_array.itemsize`.
+    - Zero-Copy Export: Typed arrays return a memoryview over their live elements from view(),
+      which can be passed to struct, file writes, sockets or NumPy without copying.
+    - Sequence Protocol: len(), iteration, `in`, indexing (including negative indices), slicing
+      and item assignment work directly on the live region, without building intermediate lists.
+    - Value Index: enable_index() maintains a hash index from values to positions, so `in`,
+      index_of() and remove() find values without scanning.
+    - Instrumentation: enable_stats() counts resizes and copied elements and tracks occupancy,
+      with an optional callback on every resize. See stats().
+    - Binary Snapshots: save() and load() write and read a typed array as a small header followed
+      by the raw element bytes, so checkpoints are limited by disk speed.
+    - Vectorized Bulk Operations: map_vectorized(), filter_vectorized(), reduce(), argmin(),
+      cumsum() and the arithmetic operators (+, -, *, /) run in NumPy on typed arrays when NumPy
+      is installed, via the zero-copy ndarray from as_ndarray(). Without NumPy, or on untyped
+      arrays, they run in pure Python. map() and filter() always call their function per element.
+      Both backends pick the same result typecode and never wrap integers around: results widen
+      like np.result_type() or raise OverflowError.
 
     Use Cases:
     - Understanding dynamic arrays in Python.
@@ -16,16 +401,66 @@ class DynamicArray:
     - Simulating low-level array behaviors in higher-level languages.
     """
 
-    def __init__(self, initial_capacity: int = 4):
+    FILE_HEADER = struct.Struct("<8scBc5xqq")  # magic, typecode, itemsize, byte order, padding, size, capacity
+    FILE_MAGIC = b"DYNARR01"
+    FILE_BYTEORDER = b"<" if sys.byteorder == "little" else b">"  # Order of the element bytes
+
+    def __init__(self, initial_capacity: int = 4, typecode: str = None, growth_policy=None, shrink_policy=None):
         """
         Initializes the dynamic array with a given capacity.
         
         Args:
             initial_capacity (int): The initial capacity of the dynamic array. Default is 4.
+            typecode (str, optional): An array module typecode (e.g. 'q' or 'd'). When given, the
+                elements are stored unboxed in an array.array. Default is None (a Python list).
+            growth_policy (GrowthPolicy, optional): How capacity grows when full. Defaults to doubling.
+            shrink_policy (ShrinkPolicy, optional): How capacity shrinks after removals. Defaults to
+                halving when occupancy falls below 25%.
+        
+        Raises:
+            ValueError: If the typecode is not supported by the array module.
         """
-        self.array = [None] * initial_capacity  # Allocating memory blocks
+        if typecode is not None:
+            _check_typecode(typecode)
+        self.typecode = typecode  # None for the untyped (list) storage mode
+        self.array = self._allocate(initial_capacity)  # Allocating memory blocks
+        self._empty = None if typecode is None else self._allocate(1)[0]  # Value stored in an unused slot
         self._capacity = initial_capacity  # Total memory capacity
         self.size = 0  # Number of elements currently in the array
+        self.growth_policy = growth_policy if growth_policy is not None else GrowthPolicy()
+        self.shrink_policy = shrink_policy if shrink_policy is not None else ShrinkPolicy()
+        self._value_index = None  # Optional ValueIndex, see enable_index()
+        self._stats = None  # Optional ResizeStats, see enable_stats()
+
+    @property
+    def itemsize(self) -> int:
+        """
+        Returns the number of bytes used by one slot of the backing storage.
+        
+        Returns:
+            int: The typecode's item size for typed arrays, or the pointer size (8 bytes on
+            64-bit builds) for untyped arrays, which excludes the boxed objects themselves.
+        """
+        if self.typecode is None:
+            return struct.calcsize('P')
+        return self.array.itemsize
+
+    def _allocate(self, capacity: int):
+        """
+        Allocates a zero-initialized block of storage with the given capacity.
+        
+        Args:
+            capacity (int): The number of slots to allocate.
+        
+        Returns:
+            list | array.array: A list of None values, or a zero-filled array.array for typed arrays.
+        
+        Time Complexity: O(capacity).
+        """
+        if self.typecode is None:
+            return [None] * capacity
+        zero = array.array(self.typecode, bytes(array.array(self.typecode).itemsize))
+        return zero * capacity  # Repetition fills the block in C without a temporary bytes object
 
     def append(self, value: int):
         """
@@ -39,9 +474,11 @@ class DynamicArray:
         - O(n) in worst-case when resizing occurs.
         """
         if self.size == self._capacity:
-            self._resize(self._capacity * 2)  # Double the capacity when full
+            self._resize(self.growth_policy.grow(self._capacity, self.size + 1))  # Grow the capacity when full
         self.array[self.size] = value
         self.size += 1
+        if self._value_index is not None:
+            self._index_appended((value,))
 
     def _resize(self, new_capacity: int):
         """
@@ -50,108 +487,2972 @@ class DynamicArray:
         Args:
             new_capacity (int): The new capacity for the array.
         
+        Raises:
+            BufferError: If a view returned by view() is still alive, since it would keep
+                pointing at the old storage.
+        
         Time Complexity: O(n), where n is the number of elements in the array.
         """
-        new_array = [None] * new_capacity
-        for i in range(self.size):
-            new_array[i] = self.array[i]
+        if self._has_views():
+            raise BufferError("Cannot resize the array while views of it exist. Release them first.")
+        new_array = self._allocate(new_capacity)
+        new_array[:self.size] = self.array[:self.size]  # Bulk copy instead of a per-element loop
         self.array = new_array
         self._capacity = new_capacity
 
-    def remove(self, value: int):
+    def _reserve(self, min_capacity: int):
         """
-        Removes the first occurrence of the specified value from the array.
-        Shifts elements to fill the gap.
+        Ensures the array can hold at least `min_capacity` elements using at most one resize.
         
         Args:
-            value (int): The value to remove from the array.
+            min_capacity (int): The number of elements the array must be able to hold.
+        
+        Time Complexity: O(n) if a resize occurs, O(1) otherwise.
+        """
+        if min_capacity > self._capacity:
+            self._resize(self.growth_policy.grow(self._capacity, min_capacity))
+
+    def _maybe_shrink(self):
+        """
+        Shrinks the capacity in a single resize if the shrink policy asks for it.
+        
+        Time Complexity: O(n) if a resize occurs, O(1) otherwise.
+        """
+        new_capacity = self.shrink_policy.shrink(self.size, self._capacity)
+        if new_capacity is not None and not self._has_views():  # Shrinking is optional, so skip it while viewed
+            self._resize(new_capacity)
+
+    def view(self) -> memoryview:
+        """
+        Returns a zero-copy memoryview over the live elements of a typed array.
+        
+        While the view (or any slice of it) is alive, the array refuses to resize: appends that
+        need more capacity raise BufferError and automatic shrinking is skipped. Use the view as a
+        context manager, or call its release() method, to lift the restriction.
+        
+        Returns:
+            memoryview: A view of the first `size` elements, formatted with the array's typecode.
         
         Raises:
-            ValueError: If the value is not found in the array.
+            TypeError: If the array uses untyped (list) storage, which has no raw buffer.
         
-        Time Complexity: O(n), where n is the number of elements in the array.
+        Example:
+            with dyn_array.view() as data:
+                file.write(data)
+        
+        Time Complexity: O(1).
         """
-        for i in range(self.size):
-            if self.array[i] == value:
-                self._shift_left(i)
-                return
-        raise ValueError(f"Value {value} not found in the array.")
+        if self.typecode is None:
+            raise TypeError("Only typed arrays expose a buffer. Create the array with a typecode.")
+        return memoryview(self.array)[:self.size]
 
-    def _shift_left(self, index: int):
+    def _has_views(self) -> bool:
         """
-        Shifts elements to the left from the specified index.
+        Checks whether a memoryview of the backing storage is still alive.
         
-        Args:
-            index (int): The index to start shifting from.
+        Returns:
+            bool: True if the typed storage is currently exporting its buffer.
         
-        Time Complexity: O(n), where n is the number of elements after the index.
+        Time Complexity: O(1) amortized.
         """
-        for i in range(index, self.size - 1):
-            self.array[i] = self.array[i + 1]
-        self.array[self.size - 1] = None
-        self.size -= 1
+        if self.typecode is None:
+            return False
+        try:
+            self.array.append(self._empty)  # array.array refuses to change size while exported
+        except BufferError:
+            return True
+        self.array.pop()
+        return False
 
-    def access(self, index: int) -> int:
+    def shrink_to_fit(self):
         """
-        Accesses the element at the specified index.
+        Releases all unused capacity so that the capacity equals the number of elements.
+        
+        Time Complexity: O(n).
+        """
+        if self._capacity != self.size:
+            self._resize(self.size)
+
+    def _as_storage(self, iterable):
+        """
+        Converts an iterable into a block matching the backing storage, ready for slice assignment.
         
         Args:
-            index (int): The index of the element to access.
+            iterable (iterable): The values to convert.
         
         Returns:
-            int: The value at the specified index.
+            list | array.array: A list for untyped arrays, or an array.array with this array's typecode.
+        
+        Time Complexity: O(k), where k is the number of values.
+        """
+        if self.typecode is None:
+            return iterable if isinstance(iterable, list) else list(iterable)
+        if isinstance(iterable, array.array) and iterable.typecode == self.typecode:
+            return iterable
+        return array.array(self.typecode, iterable)
+
+    def extend(self, iterable):
+        """
+        Appends every value from an iterable, resizing at most once.
+        
+        Args:
+            iterable (iterable): The values to append.
+        
+        Time Complexity: O(n + k), where k is the number of appended values.
+        """
+        items = self._as_storage(iterable)
+        count = len(items)
+        self._reserve(self.size + count)
+        self.array[self.size:self.size + count] = items
+        self.size += count
+        if self._value_index is not None:
+            self._index_appended(items)
+
+    def insert_many(self, index: int, items):
+        """
+        Inserts a sequence of values before the given index, resizing at most once.
+        
+        Args:
+            index (int): The position of the first inserted value (0 <= index <= size).
+            items (iterable): The values to insert, in order.
         
         Raises:
             IndexError: If the index is out of range.
         
-        Time Complexity: O(1).
+        Time Complexity: O(n + k), where k is the number of inserted values.
         """
-        if index < 0 or index >= self.size:
+        if index < 0 or index > self.size:
             raise IndexError("Index out of range.")
-        return self.array[index]
+        items = self._as_storage(items)
+        count = len(items)
+        self._reserve(self.size + count)
+        self.array[index + count:self.size + count] = self.array[index:self.size]  # Shift the tail right
+        self.array[index:index + count] = items
+        self.size += count
+        self._invalidate_index()
 
-    def __str__(self):
+    def insert(self, index: int, value: int):
         """
-        Returns a string representation of the array.
+        Inserts a value before the given index, shifting later elements one slot to the right.
         
-        Returns:
-            str: The string representation of the array's elements.
+        Args:
+            index (int): The position of the new value (0 <= index <= size).
+            value (int): The value to insert.
         
-        Example:
-            [10, 20, 30]
+        Raises:
+            IndexError: If the index is out of range.
+        
+        Time Complexity: O(n - index), plus O(n) if a resize occurs.
         """
-        return str([self.array[i] for i in range(self.size)])
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range.")
+        if self.size == self._capacity:
+            self._resize(self.growth_policy.grow(self._capacity, self.size + 1))
+        self.array[index + 1:self.size + 1] = self.array[index:self.size]  # Shift the tail right
+        self.array[index] = value
+        self.size += 1
+        self._invalidate_index()
 
-    def capacity(self) -> int:
+    @classmethod
+    def from_iterable(cls, iterable, typecode: str = None):
         """
-        Returns the current capacity of the array.
+        Builds a dynamic array sized exactly for the given values.
+        
+        Args:
+            iterable (iterable): The initial values.
+            typecode (str, optional): An array module typecode for typed storage. Default is None.
         
         Returns:
-            int: The capacity of the array.
+            DynamicArray: A new array containing the values, allocated once.
         
-        Time Complexity: O(1).
+        Time Complexity: O(k), where k is the number of values.
         """
-        return self._capacity
+        dyn_array = cls(initial_capacity=0, typecode=typecode)
+        dyn_array.extend(iterable)  # Single allocation of exactly len(iterable) slots
+        return dyn_array
 
-    def print_memory(self):
+    def remove(self, value: int):
         """
-        Prints the memory layout of the array, showing used and unused blocks.
+        Removes the first occurrence of the specified value from the array.
+        Shifts elements to fill the gap.
         
-        Example:
-            Memory Layout: [10] [20] [30] [None]
+        Args:
+            value (int): The value to remove from the array.
+        
+        Raises:
+            ValueError: If the value is not found in the array.
+        
+        Time Complexity: O(n), where n is the number of elements in the array. With the value
+        index enabled, the value is found without scanning and only the shift is O(n).
         """
-        grid = [f"[{self.array[i]}]" if i < self.size else "[None]" for i in range(self._capacity)]
-        print("Memory Layout:", " ".join(grid))
+        index = self._fresh_index()
+        if index is not None:
+            if value not in index.keys:
+                raise ValueError(f"Value {value} not found in the array.")
+            self._shift_left(index.discard_first(value))
+            if len(index.removed) > max(64, self.size // 8):
+                index.stale = True  # Fold the removed keys back in on the next lookup
+            self._maybe_shrink()
+            return
+        for i in range(self.size):
+            if self.array[i] == value:
+                self._shift_left(i)
+                self._maybe_shrink()
+                return
+        raise ValueError(f"Value {value} not found in the array.")
 
-# Example usage
-if __name__ == "__main__":
-    # Initialize a dynamic array
-    dyn_array = DynamicArray(initial_capacity=4)
+    def index_of(self, value) -> int:
+        """
+        Returns the position of the first occurrence of a value.
+        
+        Args:
+            value (int): The value to look up.
+        
+        Returns:
+            int: The index of the first occurrence.
+        
+        Raises:
+            ValueError: If the value is not found in the array.
+        
+        Time Complexity: O(n) scan, or O(log r) with the value index enabled.
+        """
+        index = self._fresh_index()
+        if index is not None:
+            position = index.find(value)
+        else:
+            position = next((i for i, element in enumerate(self) if element == value), -1)
+        if position < 0:
+            raise ValueError(f"Value {value} not found in the array.")
+        return position
 
-    # Append elements
-    dyn_array.append(10)
-    dyn_array.append(20)
-    dyn_array.append(30)
+    def enable_index(self, lazy: bool = False):
+        """
+        Turns on the value index used by `in`, index_of() and remove().
+        
+        Args:
+            lazy (bool): If True, every mutation only marks the index stale and the next lookup
+                rebuilds it in one O(n) pass. Use this around bulk loads. If False, append, extend,
+                remove and item assignment keep it up to date in place. Positional inserts and
+                batched removals always mark it stale. Default is False.
+        
+        Time Complexity: O(n) to build the index (deferred to the first lookup when lazy).
+        """
+        self._value_index = ValueIndex(lazy)
+        if not lazy:
+            self.rebuild_index()
+
+    def disable_index(self):
+        """
+        Turns off the value index and frees its memory.
+        """
+        self._value_index = None
+
+    def rebuild_index(self):
+        """
+        Rebuilds the value index from the live elements.
+        
+        Raises:
+            ValueError: If the index is not enabled.
+        
+        Time Complexity: O(n).
+        """
+        if self._value_index is None:
+            raise ValueError("The value index is not enabled. Call enable_index() first.")
+        self._value_index.rebuild(iter(self))
+
+    def index_memory(self) -> int:
+        """
+        Returns the approximate extra memory, in bytes, used by the value index (0 when disabled).
+        """
+        index = self._fresh_index()
+        return 0 if index is None else index.memory_usage()
+
+    def _fresh_index(self):
+        """
+        Returns the value index, rebuilding it first if it is stale, or None if it is disabled.
+        """
+        index = self._value_index
+        if index is not None and index.stale:
+            index.rebuild(iter(self))
+        return index
+
+    def _invalidate_index(self):
+        """
+        Marks the value index stale after a change it does not track incrementally.
+        """
+        if self._value_index is not None:
+            self._value_index.stale = True
+
+    def _index_appended(self, values):
+        """
+        Records values appended at the end of the array in the value index.
+        """
+        index = self._value_index
+        if index.lazy or index.stale:
+            index.stale = True
+        else:
+            for value in values:
+                index.add(value)
+
+    def remove_if(self, predicate) -> int:
+        """
+        Removes every element for which the predicate returns True, preserving the order of the rest.
+        Survivors are compacted in a single pass and the capacity is shrunk at most once.
+        
+        Args:
+            predicate (callable): A function taking an element and returning True to remove it.
+        
+        Returns:
+            int: The number of elements removed.
+        
+        Time Complexity: O(n), regardless of how many elements are removed.
+        """
+        kept = self._as_storage([value for value in self.array[:self.size] if not predicate(value)])
+        return self._compact(kept)
+
+    def remove_all(self, value) -> int:
+        """
+        Removes every occurrence of the specified value from the array.
+        
+        Args:
+            value (int): The value to remove.
+        
+        Returns:
+            int: The number of elements removed (0 if the value is not present).
+        
+        Time Complexity: O(n).
+        """
+        return self.remove_if(lambda element: element == value)
+
+    def remove_indices(self, indices) -> int:
+        """
+        Removes the elements at the given positions in one pass. Duplicate indices are ignored.
+        
+        Args:
+            indices (iterable[int]): The positions to remove.
+        
+        Returns:
+            int: The number of elements removed.
+        
+        Raises:
+            IndexError: If any index is out of range. The array is left unchanged.
+        
+        Time Complexity: O(n + k), where k is the number of indices.
+        """
+        drop = set(indices)
+        for index in drop:
+            if index < 0 or index >= self.size:
+                raise IndexError("Index out of range.")
+        kept = self._as_storage([value for i, value in enumerate(self.array[:self.size]) if i not in drop])
+        return self._compact(kept)
+
+    def _compact(self, kept) -> int:
+        """
+        Replaces the live region with the surviving elements and shrinks the capacity once if needed.
+        
+        Args:
+            kept (list | array.array): The surviving elements, already in storage format.
+        
+        Returns:
+            int: The number of elements removed.
+        
+        Time Complexity: O(n).
+        """
+        new_size = len(kept)
+        removed = self.size - new_size
+        self.array[:new_size] = kept
+        self.array[new_size:self.size] = self._allocate(removed)  # Reset the freed slots
+        self.size = new_size
+        if removed:
+            self._invalidate_index()
+        self._maybe_shrink()  # Shrink once, no matter how many elements were removed
+        return removed
+
+    def _shift_left(self, index: int):
+        """
+        Shifts elements to the left from the specified index.
+        
+        Args:
+            index (int): The index to start shifting from.
+        
+        Time Complexity: O(n), where n is the number of elements after the index.
+        """
+        self.array[index:self.size - 1] = self.array[index + 1:self.size]  # Bulk move in C
+        self.array[self.size - 1] = self._empty
+        self.size -= 1
+
+    def access(self, index: int) -> int:
+        """
+        Accesses the element at the specified index.
+        
+        Args:
+            index (int): The index of the element to access.
+        
+        Returns:
+            int: The value at the specified index.
+        
+        Raises:
+            IndexError: If the index is out of range.
+        
+        Time Complexity: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        return self.array[index]
+
+    def __str__(self):
+        """
+        Returns a string representation of the array.
+        
+        Returns:
+            str: The string representation of the array's elements.
+        
+        Example:
+            [10, 20, 30]
+        """
+        return str([self.array[i] for i in range(self.size)])
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the array.
+        
+        Time Complexity: O(1).
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Returns a lazy iterator over the live elements. No intermediate list is built.
+        
+        Time Complexity: O(1) to create, O(n) to exhaust.
+        """
+        return itertools.islice(self.array, self.size)
+
+    def __contains__(self, value) -> bool:
+        """
+        Checks whether the value is stored in the array, scanning the live region in C.
+        
+        Time Complexity: O(n), or O(1) with the value index enabled.
+        """
+        index = self._fresh_index()
+        if index is not None:
+            return value in index.keys
+        return value in iter(self)
+
+    def _normalize_index(self, index: int) -> int:
+        """
+        Converts a possibly negative index into a position in the live region.
+        
+        Args:
+            index (int): The index, where -1 refers to the last element.
+        
+        Returns:
+            int: The equivalent non-negative index.
+        
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        return index
+
+    def __getitem__(self, index):
+        """
+        Returns the element at an index, or a compact copy of a slice.
+        
+        Args:
+            index (int | slice): The index (negative values count from the end) or slice.
+        
+        Returns:
+            int | DynamicArray: The element, or a new DynamicArray holding just the sliced
+            elements. For a zero-copy slice of a typed array, use view()[start:stop] instead.
+        
+        Raises:
+            IndexError: If the index is out of range.
+        
+        Time Complexity: O(1) for an index, O(k) for a slice of k elements.
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(self.size))
+            if not positions:
+                return self._from_storage(self._allocate(0))
+            stop = positions[-1] + positions.step
+            part = self.array[positions[0]:stop if stop >= 0 else None:positions.step]
+            return self._from_storage(self._as_storage(part))
+        return self.array[self._normalize_index(index)]
+
+    def __setitem__(self, index: int, value):
+        """
+        Replaces the element at an index.
+        
+        Args:
+            index (int): The index (negative values count from the end).
+            value (int): The new value.
+        
+        Raises:
+            IndexError: If the index is out of range.
+        
+        Time Complexity: O(1).
+        """
+        index = self._normalize_index(index)
+        old_value = self.array[index]
+        self.array[index] = value  # Store first: a value the storage rejects leaves the index intact
+        if self._value_index is not None:
+            if self._value_index.lazy or self._value_index.stale:
+                self._value_index.stale = True
+            else:
+                self._value_index.replace(index, old_value, self.array[index])
+
+    def take(self, indices):
+        """
+        Gathers the elements at several indices into a new array with one bounds check.
+        
+        Args:
+            indices (iterable[int]): The indices to gather (negative values count from the end).
+        
+        Returns:
+            DynamicArray: A new array holding the gathered elements, in the order given.
+        
+        Raises:
+            IndexError: If any index is out of range.
+        
+        Time Complexity: O(k), where k is the number of indices.
+        """
+        indices = list(indices)
+        if not indices:
+            return self._from_storage(self._allocate(0))
+        if min(indices) < -self.size or max(indices) >= self.size:
+            raise IndexError("Index out of range.")
+        if min(indices) < 0:
+            indices = [index + self.size if index < 0 else index for index in indices]
+        values = operator.itemgetter(*indices)(self.array)  # Gathers in C
+        return self._from_storage(self._as_storage(values if len(indices) > 1 else (values,)))
+
+    def _from_storage(self, storage):
+        """
+        Wraps an already-built storage block in a new DynamicArray without copying it.
+        
+        Args:
+            storage (list | array.array): The elements, in this array's storage format.
+        
+        Returns:
+            DynamicArray: A new array whose size and capacity equal len(storage).
+        """
+        typecode = storage.typecode if isinstance(storage, array.array) else None
+        dyn_array = DynamicArray(0, typecode, self.growth_policy, self.shrink_policy)
+        dyn_array.array = storage
+        dyn_array._capacity = dyn_array.size = len(storage)
+        return dyn_array
+
+    def as_ndarray(self):
+        """
+        Returns a zero-copy NumPy array over the live elements of a typed array.
+        
+        Writes to the ndarray change the DynamicArray. Like view(), the array refuses to resize
+        while the ndarray is alive.
+        
+        Returns:
+            numpy.ndarray: A one-dimensional array of `size` elements with the matching dtype.
+        
+        Raises:
+            ImportError: If NumPy is not installed.
+            TypeError: If the array uses untyped (list) storage.
+        
+        Time Complexity: O(1).
+        """
+        if np is None:
+            raise ImportError("as_ndarray() requires NumPy. Install it with 'pip install numpy'.")
+        return np.frombuffer(self.view(), dtype=self.typecode)
+
+    def _vector(self):
+        """
+        Returns the live elements as an ndarray if the NumPy backend applies, or None otherwise.
+        """
+        if np is None or self.typecode is None:
+            return None
+        return self.as_ndarray()
+
+    def _from_vector(self, values, typecode: str):
+        """
+        Copies the result of a NumPy operation into a new DynamicArray.
+        
+        Args:
+            values (numpy.ndarray): The computed elements.
+            typecode (str): The typecode of the new array.
+        
+        Returns:
+            DynamicArray: A new typed array holding the values.
+        
+        Raises:
+            TypeError: If the values cannot be safely cast to the typecode (e.g. floats to 'q').
+            OverflowError: If an integer value does not fit the typecode, as array.array raises.
+        """
+        if values.dtype.kind in 'biu' and typecode not in ('f', 'd') and values.size:
+            low, high = _typecode_range(typecode)
+            if int(values.min()) < low or int(values.max()) > high:
+                raise OverflowError(f"A value does not fit in typecode {typecode!r} (range {low} to {high}).")
+        values = values.astype(typecode, casting="same_kind", copy=False)
+        return self._from_storage(array.array(typecode, values.tobytes()))
+
+    def _from_values(self, values, typecode: str):
+        """
+        Builds a new DynamicArray from an iterable of pure-Python results.
+        """
+        return self._from_storage(list(values) if typecode is None else array.array(typecode, values))
+
+    def map(self, func, typecode: str = None):
+        """
+        Applies a function to every element and returns the results as a new array.
+        
+        The function is called once per element, with or without NumPy. A NumPy ufunc (e.g.
+        np.sqrt) runs as a single C loop instead. See map_vectorized() for functions written
+        for whole arrays.
+        
+        Args:
+            func (callable): A function of one element.
+            typecode (str, optional): The typecode of the result. Defaults to this array's typecode.
+        
+        Returns:
+            DynamicArray: A new array of the same length.
+        
+        Time Complexity: O(n).
+        """
+        if np is not None and isinstance(func, np.ufunc):
+            return self.map_vectorized(func, typecode)
+        typecode = typecode if typecode is not None else self.typecode
+        return self._from_values((func(value) for value in self), typecode)
+
+    def map_vectorized(self, func, typecode: str = None):
+        """
+        Like map(), but with NumPy the function is called once on the whole ndarray, so it must
+        work elementwise on arrays (operators and NumPy functions, e.g. lambda x: x * 2 + 1, but
+        not `if` or `and`). Without NumPy, or on untyped arrays, it is called once per element.
+        
+        Args:
+            func (callable): A function of a whole array.
+            typecode (str, optional): The typecode of the result. Defaults to this array's typecode.
+        
+        Returns:
+            DynamicArray: A new array of the same length.
+        
+        Time Complexity: O(n), in a single C loop per operation with NumPy.
+        """
+        typecode = typecode if typecode is not None else self.typecode
+        data = self._vector()
+        if data is not None:
+            return self._from_vector(np.asarray(func(data)), typecode)
+        return self._from_values((func(value) for value in self), typecode)
+
+    def filter(self, predicate):
+        """
+        Returns a new array with the elements for which the predicate is true, in order.
+        
+        The predicate is called once per element, with or without NumPy. See filter_vectorized()
+        for predicates written for whole arrays.
+        
+        Args:
+            predicate (callable): A condition on one element.
+        
+        Returns:
+            DynamicArray: A new array holding the matching elements.
+        
+        Time Complexity: O(n).
+        """
+        return self._from_values((value for value in self if predicate(value)), self.typecode)
+
+    def filter_vectorized(self, predicate):
+        """
+        Like filter(), but with NumPy the predicate is called once on the whole ndarray and must
+        return a boolean mask (e.g. lambda x: x % 2 == 0; combine conditions with & and |, not
+        `and` and `or`). Without NumPy, or on untyped arrays, it is called once per element.
+        
+        Args:
+            predicate (callable): A condition on a whole array.
+        
+        Returns:
+            DynamicArray: A new array holding the matching elements.
+        
+        Time Complexity: O(n), in a single C loop per operation with NumPy.
+        """
+        data = self._vector()
+        if data is not None:
+            return self._from_vector(data[np.asarray(predicate(data), dtype=bool)], self.typecode)
+        return self._from_values((value for value in self if predicate(value)), self.typecode)
+
+    def reduce(self, func, initial=None):
+        """
+        Folds the elements into a single value from left to right, like functools.reduce.
+        
+        With NumPy, operator.add, operator.mul, min, max, the bitwise operators and any NumPy
+        ufunc run as a single C loop. Other functions are applied per element. Note that NumPy
+        integer sums wrap around at the typecode's limits, while Python integers do not.
+        
+        Args:
+            func (callable): A two-argument function (e.g. operator.add).
+            initial (optional): The starting value. Default is None (start from the first element).
+        
+        Returns:
+            The folded value, as a Python number.
+        
+        Raises:
+            TypeError: If the array is empty and no initial value is given.
+        
+        Time Complexity: O(n).
+        """
+        if self.size == 0 and initial is None:
+            raise TypeError("reduce() of an empty array with no initial value.")
+        data = self._vector()
+        ufunc = None
+        if data is not None:
+            ufunc = func if isinstance(func, np.ufunc) else _NUMPY_REDUCERS.get(func)
+        if ufunc is None:
+            if initial is None:
+                return functools.reduce(func, self)
+            return functools.reduce(func, self, initial)
+        if initial is None:
+            return ufunc.reduce(data).item()
+        return ufunc.reduce(data, initial=initial).item()
+
+    def argmin(self) -> int:
+        """
+        Returns the index of the smallest element (the first one if there are ties).
+        
+        Raises:
+            ValueError: If the array is empty.
+        
+        Time Complexity: O(n).
+        """
+        if self.size == 0:
+            raise ValueError("argmin() of an empty array.")
+        data = self._vector()
+        if data is not None:
+            return int(np.argmin(data))
+        return min(enumerate(self), key=operator.itemgetter(1))[0]
+
+    def cumsum(self):
+        """
+        Returns the running totals of the elements as a new array of the same typecode.
+        
+        Float totals are accumulated in double precision. Integer totals never wrap around: with
+        NumPy they are computed in the typecode only if no total can leave its range.
+        
+        Example:
+            [1, 2, 3] -> [1, 3, 6]
+        
+        Raises:
+            OverflowError: If a running total does not fit in the typecode.
+        
+        Time Complexity: O(n).
+        """
+        data = self._vector()
+        if data is not None:
+            if self.typecode in ('f', 'd'):
+                return self._from_vector(np.cumsum(data, dtype='d'), self.typecode)
+            low, high = _typecode_range(self.typecode)
+            # The k-th total lies between k times the smallest and k times the largest element
+            if not data.size or low <= int(data.min()) * data.size and int(data.max()) * data.size <= high:
+                return self._from_vector(np.cumsum(data, dtype=data.dtype), self.typecode)
+        return self._from_values(itertools.accumulate(self), self.typecode)
+
+    def _result_typecode(self, other, true_division: bool):
+        """
+        Picks the typecode of an elementwise result, the same way with and without NumPy.
+        
+        The typecodes are promoted like np.result_type() (see _promote_typecodes()). A Python
+        int takes this array's typecode and a Python float counts as 'd'. Division of integers
+        gives 'd'. If either side is an untyped array, the result is untyped too.
+        """
+        other_code = other.typecode if isinstance(other, DynamicArray) else 'd' if isinstance(other, float) else self.typecode
+        if self.typecode is None or other_code is None:
+            return None
+        typecode = _promote_typecodes(self.typecode, other_code)
+        return 'd' if true_division and typecode not in ('f', 'd') else typecode
+
+    def _elementwise(self, other, op, true_division: bool = False):
+        """
+        Combines the array elementwise with another array of the same length or with a number.
+        
+        Args:
+            other (DynamicArray | int | float): The right-hand operand.
+            op (callable): The operator function (e.g. operator.add), which NumPy also accepts on ndarrays.
+            true_division (bool): Whether the operation always produces floats.
+        
+        Returns:
+            DynamicArray: A new array with the results, or NotImplemented for other operand types.
+        
+        Both operands are converted to the result typecode first, so float results are rounded
+        the same way with and without NumPy. Integer results never wrap around: NumPy computes
+        them in the result typecode only if the operands' extremes show that no result can leave
+        its range, and otherwise the exact Python path decides.
+        
+        Raises:
+            ValueError: If the two arrays have different lengths.
+            OverflowError: If an integer result does not fit in the result typecode.
+            ZeroDivisionError: On division by zero without NumPy. NumPy follows IEEE 754 and
+                produces inf or nan instead.
+        
+        Time Complexity: O(n).
+        """
+        if isinstance(other, DynamicArray):
+            if len(other) != self.size:
+                raise ValueError(f"Arrays have different lengths ({self.size} and {len(other)}).")
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        typecode = self._result_typecode(other, true_division)
+        if typecode is not None and np is not None:
+            left = self.as_ndarray()
+            right = other.as_ndarray() if isinstance(other, DynamicArray) else other
+            if typecode in ('f', 'd') or _fits_typecode(op, left, right, typecode):
+                right = np.asarray(right, dtype=typecode)
+                return self._from_vector(op(left.astype(typecode, copy=False), right), typecode)
+        values = self
+        if typecode in ('f', 'd'):
+            values = array.array(typecode, self)
+            if isinstance(other, DynamicArray):
+                other = array.array(typecode, other)
+            else:
+                other = array.array(typecode, [other])[0]
+        if isinstance(other, (DynamicArray, array.array)):
+            return self._from_values(map(op, values, other), typecode)
+        return self._from_values((op(value, other) for value in values), typecode)
+
+    def __add__(self, other):
+        """
+        Returns `self + other` elementwise as a new array. See _elementwise().
+        """
+        return self._elementwise(other, operator.add)
+
+    def __sub__(self, other):
+        """
+        Returns `self - other` elementwise as a new array. See _elementwise().
+        """
+        return self._elementwise(other, operator.sub)
+
+    def __mul__(self, other):
+        """
+        Returns `self * other` elementwise as a new array. See _elementwise().
+        """
+        return self._elementwise(other, operator.mul)
+
+    def __truediv__(self, other):
+        """
+        Returns `self / other` elementwise as a new array. See _elementwise().
+        """
+        return self._elementwise(other, operator.truediv, true_division=True)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def capacity(self) -> int:
+        """
+        Returns the current capacity of the array.
+        
+        Returns:
+            int: The capacity of the array.
+        
+        Time Complexity: O(1).
+        """
+        return self._capacity
+
+    def save(self, path: str):
+        """
+        Writes a typed array to a binary file: a 32-byte header (magic, typecode, item size, byte
+        order, size, capacity) followed by the raw bytes of the live elements, written straight from
+        the backing buffer in the machine's byte order. The file can be read back with load() or
+        opened with MappedDynamicArray.
+        
+        Args:
+            path (str): The file to write.
+        
+        Raises:
+            TypeError: If the array uses untyped (list) storage.
+        
+        Time Complexity: O(n), as a single write of n * itemsize bytes.
+        """
+        with self.view() as data, open(path, "wb") as file:
+            file.write(self.FILE_HEADER.pack(self.FILE_MAGIC, self.typecode.encode(), data.itemsize,
+                                             self.FILE_BYTEORDER, self.size, self._capacity))
+            file.write(data)
+
+    @classmethod
+    def load(cls, path: str, growth_policy=None, shrink_policy=None):
+        """
+        Reads an array written by save(), reading the element bytes directly into the new backing
+        buffer with readinto(), without parsing individual elements. Files written on a machine of
+        the other byte order are byteswapped after reading.
+        
+        Args:
+            path (str): The file to read.
+            growth_policy (GrowthPolicy, optional): How capacity grows when full. Defaults to doubling.
+            shrink_policy (ShrinkPolicy, optional): How capacity shrinks after removals.
+        
+        Returns:
+            DynamicArray: The loaded array, with the saved typecode, size and capacity.
+        
+        Raises:
+            ValueError: If the file is not a saved array, was written on a platform with a
+                different item size, or is truncated.
+        
+        Time Complexity: O(n), as a single read of n * itemsize bytes.
+        """
+        with open(path, "rb") as file:
+            header = file.read(cls.FILE_HEADER.size)
+            if len(header) < cls.FILE_HEADER.size or header[:len(cls.FILE_MAGIC)] != cls.FILE_MAGIC:
+                raise ValueError(f"{path} is not a saved dynamic array file.")
+            _, typecode, itemsize, byteorder, size, capacity = cls.FILE_HEADER.unpack(header)
+            swap = _check_byteorder(path, byteorder) != cls.FILE_BYTEORDER
+            dyn_array = cls(capacity, typecode.decode(), growth_policy, shrink_policy)
+            if dyn_array.itemsize != itemsize:
+                raise ValueError(f"{path} was saved with {itemsize}-byte elements, "
+                                 f"but {typecode.decode()!r} is {dyn_array.itemsize} bytes here.")
+            with memoryview(dyn_array.array).cast("B") as target:
+                filled, total = 0, size * itemsize
+                while filled < total:
+                    count = file.readinto(target[filled:total])
+                    if not count:
+                        raise ValueError(f"{path} is truncated.")
+                    filled += count
+            if swap:
+                dyn_array.array.byteswap()
+            dyn_array.size = size
+        return dyn_array
+
+    def enable_stats(self, on_resize=None):
+        """
+        Starts collecting resize and occupancy statistics, readable through stats().
+        
+        Instrumentation works by shadowing append and _resize with counting wrappers on this
+        instance only. When it is disabled the wrappers are removed, so an uninstrumented array
+        runs exactly the original code with zero overhead.
+        
+        Args:
+            on_resize (callable, optional): Called after every resize as
+                on_resize(old_capacity, new_capacity, size). Default is None.
+        """
+        stats = self._stats = ResizeStats(self._capacity, self.size)
+        resize = type(self)._resize.__get__(self)
+        append = type(self).append.__get__(self)
+
+        def instrumented_resize(new_capacity: int):
+            old_capacity, copied = self._capacity, min(self.size, new_capacity)
+            resize(new_capacity)
+            stats.record_resize(old_capacity, new_capacity, copied, self.size)
+            if on_resize is not None:
+                on_resize(old_capacity, new_capacity, self.size)
+
+        def instrumented_append(value):
+            append(value)
+            stats.sample(self.size, self._capacity)
+
+        self._resize = instrumented_resize
+        self.append = instrumented_append
+
+    def disable_stats(self):
+        """
+        Stops collecting statistics and restores the uninstrumented methods.
+        """
+        self.__dict__.pop("_resize", None)
+        self.__dict__.pop("append", None)
+        self._stats = None
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics collected since enable_stats().
+        
+        Returns:
+            dict: The counters of ResizeStats plus:
+            - resizes: grows + shrinks.
+            - wasted_slots: unused slots right now (capacity - size).
+            - amortized_copies_per_element: elements_copied / peak_size, which for an
+              append-only workload is the average copy cost paid per append.
+        
+        Raises:
+            ValueError: If statistics are not enabled.
+        """
+        stats = self._stats
+        if stats is None:
+            raise ValueError("Statistics are not enabled. Call enable_stats() first.")
+        return {
+            "resizes": stats.grows + stats.shrinks,
+            "grows": stats.grows,
+            "shrinks": stats.shrinks,
+            "elements_copied": stats.elements_copied,
+            "peak_capacity": stats.peak_capacity,
+            "peak_size": stats.peak_size,
+            "wasted_slots": self._capacity - self.size,
+            "amortized_copies_per_element": stats.elements_copied / max(stats.peak_size, 1),
+            "occupancy_histogram": list(stats.occupancy_histogram),
+        }
+
+    def print_memory(self):
+        """
+        Prints the memory layout of the array, showing used and unused blocks.
+        
+        Example:
+            Memory Layout: [10] [20] [30] [None]
+        """
+        grid = [f"[{self.array[i]}]" if i < self.size else "[None]" for i in range(self._capacity)]
+        print("Memory Layout:", " ".join(grid))
+
+
+class MappedDynamicArray(DynamicArray):
+    """
+    A typed dynamic array whose elements live in a memory-mapped file.
+
+    The file starts with a 32-byte header (magic, typecode, item size, byte order, size, capacity)
+    followed by `capacity` fixed-width elements in the machine's byte order. Appends and accesses go straight through the mapping, so the
+    operating system pages data in and out and the array can be larger than RAM. Resizing grows
+    the file and remaps it. Reopening an existing file only reads the header, so startup is O(1)
+    regardless of how many elements the file holds.
+
+    The size is written to the header on every change, so a reopened file always reflects the last
+    completed append or removal. Call flush() to force the data to disk, and close() (or use the
+    array as a context manager) when done.
+    """
+
+    HEADER = DynamicArray.FILE_HEADER  # Same layout as save(), so saved files can be opened mapped
+    MAGIC = DynamicArray.FILE_MAGIC
+
+    def __init__(self, path: str, typecode: str = 'q', initial_capacity: int = 4,
+                 growth_policy=None, shrink_policy=None):
+        """
+        Opens an existing mapped array file, or creates a new one.
+
+        Args:
+            path (str): The file that stores the array.
+            typecode (str): An array module typecode for the elements. Default is 'q'.
+            initial_capacity (int): The capacity of a newly created file. Ignored when reopening. Default is 4.
+            growth_policy (GrowthPolicy, optional): How capacity grows when full. Defaults to doubling.
+            shrink_policy (ShrinkPolicy, optional): How capacity shrinks after removals.
+
+        Raises:
+            ValueError: If the typecode is unsupported, or the file is not a mapped array with this
+                typecode and the machine's byte order (DynamicArray.load() converts the byte order).
+        """
+        _check_typecode(typecode)
+        self.typecode = typecode
+        self.path = path
+        self.growth_policy = growth_policy if growth_policy is not None else GrowthPolicy()
+        self.shrink_policy = shrink_policy if shrink_policy is not None else ShrinkPolicy()
+        self._empty = self._allocate(1)[0]
+        self._value_index = None
+        self._stats = None
+        self._itemsize = itemsize = array.array(typecode).itemsize
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        try:
+            if exists:
+                header = self._file.read(self.HEADER.size)
+                if len(header) < self.HEADER.size or header[:len(self.MAGIC)] != self.MAGIC:
+                    raise ValueError(f"{path} is not a mapped dynamic array file.")
+                _, stored_typecode, stored_itemsize, byteorder, size, capacity = self.HEADER.unpack(header)
+                if stored_typecode.decode() != typecode or stored_itemsize != itemsize:
+                    raise ValueError(f"{path} stores typecode {stored_typecode.decode()!r} "
+                                     f"({stored_itemsize} bytes), not {typecode!r} ({itemsize} bytes).")
+                if _check_byteorder(path, byteorder) != self.FILE_BYTEORDER and itemsize > 1:  # A mapping cannot be swapped in place
+                    raise ValueError(f"{path} was written with the other byte order. "
+                                     "Convert it with DynamicArray.load() and save().")
+                if os.path.getsize(path) < self.HEADER.size + capacity * itemsize:
+                    self._file.truncate(self.HEADER.size + capacity * itemsize)  # Files from save() omit the unused slots
+            else:
+                size, capacity = 0, initial_capacity
+                self._file.truncate(self.HEADER.size + capacity * itemsize)  # New bytes read as zero
+
+            self._capacity = capacity
+            self._remap()
+            self._size = size
+            self._write_header()
+        except BaseException:
+            self._file.close()
+            raise
+
+    @classmethod
+    def load(cls, path: str, growth_policy=None, shrink_policy=None):
+        """
+        Not supported: a saved file is opened in place with MappedDynamicArray(path, typecode),
+        without reading its elements.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("MappedDynamicArray opens saved files directly: use MappedDynamicArray(path, typecode).")
+
+    @property
+    def size(self) -> int:
+        """
+        The number of elements currently in the array, mirrored in the file header.
+        """
+        return self._size
+
+    @size.setter
+    def size(self, value: int):
+        self._size = value
+        self.HEADER.pack_into(self._mmap, 0, self.MAGIC, self.typecode.encode(), self._itemsize,
+                              self.FILE_BYTEORDER, value, self._capacity)
+
+    def _write_header(self):
+        """
+        Writes the current size and capacity to the file header.
+        """
+        self.size = self._size
+
+    def _remap(self):
+        """
+        Maps the whole file and exposes the element region as a typed memoryview in self.array.
+
+        Time Complexity: O(1); pages are loaded lazily by the operating system.
+        """
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._remap_elements()
+
+    def _unmap(self) -> bool:
+        """
+        Releases the mapping if no view returned by view() is still alive.
+
+        Returns:
+            bool: True if the mapping was released, False if it is still exported (and left intact).
+        """
+        self.array.release()
+        try:
+            self._mmap.close()  # mmap refuses to close while buffers are exported
+        except BufferError:
+            self._remap_elements()
+            return False
+        return True
+
+    def _remap_elements(self):
+        """
+        Recreates the element memoryview over the existing mapping.
+        """
+        start = self.HEADER.size
+        self.array = memoryview(self._mmap)[start:start + self._capacity * self._itemsize].cast(self.typecode)
+
+    def _has_views(self) -> bool:
+        """
+        Checks whether a memoryview of the mapping is still alive.
+
+        Returns:
+            bool: True if a view of the mapped elements is still alive.
+
+        Time Complexity: O(1).
+        """
+        if not self._unmap():
+            return True
+        self._remap()
+        return False
+
+    def _resize(self, new_capacity: int):
+        """
+        Resizes the file to hold `new_capacity` elements and remaps it. Elements stay in place.
+
+        Args:
+            new_capacity (int): The new capacity for the array.
+
+        Raises:
+            BufferError: If a view returned by view() is still alive.
+
+        Time Complexity: O(1) copies; the file system allocates (or frees) the extra blocks.
+        """
+        if not self._unmap():
+            raise BufferError("Cannot resize the array while views of it exist. Release them first.")
+        self._file.truncate(self.HEADER.size + new_capacity * self._itemsize)
+        self._capacity = new_capacity
+        self._remap()
+        self._write_header()
+
+    def flush(self):
+        """
+        Writes all modified pages of the mapping back to the file.
+        """
+        self._mmap.flush()
+
+    def close(self):
+        """
+        Flushes the mapping and closes the file. The array cannot be used afterwards.
+
+        Raises:
+            BufferError: If a view returned by view() is still alive.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        if not self._unmap():
+            raise BufferError("Cannot close the array while views of it exist. Release them first.")
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_CREATED_BLOCKS = set()  # Names of the shared blocks this process created (and its tracker owns)
+
+
+def _create_shared_block(size: int) -> shared_memory.SharedMemory:
+    """
+    Creates a shared memory block of `size` bytes, owned by this process.
+    """
+    block = shared_memory.SharedMemory(create=True, size=size)
+    _CREATED_BLOCKS.add(block.name)
+    return block
+
+
+def _attach_shared_block(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to an existing shared memory block without taking ownership of it, so this
+    process exiting never unlinks it.
+
+    Python 3.13+ leaves the block out of the resource tracker (track=False). Older versions
+    always register it, and a process with its own tracker would unlink the block when it
+    exits, so the registration is undone. Processes started by multiprocessing share their
+    parent's tracker, and the creating process is tracked already; in both cases registering
+    again changes nothing, while unregistering would drop the creator's entry, so it is kept.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track parameter
+        block = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None and block.name not in _CREATED_BLOCKS:
+            resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+class SharedDynamicArray(DynamicArray):
+    """
+    A typed dynamic array in shared memory that worker processes attach to by name, with zero copies.
+
+    Two shared blocks are used: a small control block with the metadata (typecode, item size,
+    size, capacity, a generation counter and the name of the data block), and a data block with
+    the elements. The control block keeps its name for the life of the array, so that name is
+    what workers attach to.
+
+    Concurrency model:
+    - One writer: the process that created the array. Only it may append or remove. It writes
+      an element first and publishes the new size afterwards, so readers never see a slot
+      before its value is in place.
+    - Any number of readers: processes that called attach(name) (or received the array through
+      pickling, which attaches instead of copying). Their element view is read-only.
+    - Shared blocks cannot grow, so a resize creates a new data block, copies the elements,
+      publishes its name under an odd/even generation counter (a seqlock) and unlinks the old
+      block. Readers notice the new generation on their next size check and remap.
+    """
+
+    CONTROL = struct.Struct("<8scB6xqqq32s")  # magic, typecode, itemsize, padding, size, capacity, generation, data name
+    SIZE = struct.Struct("<q")
+    SIZE_OFFSET = 16
+    GENERATION_OFFSET = 32
+    MAGIC = b"DYNSHM01"
+
+    def __init__(self, typecode: str = 'q', initial_capacity: int = 4, growth_policy=None, shrink_policy=None):
+        """
+        Creates a new shared array, owned by this process as its single writer.
+
+        Args:
+            typecode (str): An array module typecode for the elements. Default is 'q'.
+            initial_capacity (int): The initial capacity of the data block. Default is 4.
+            growth_policy (GrowthPolicy, optional): How capacity grows when full. Defaults to doubling.
+            shrink_policy (ShrinkPolicy, optional): How capacity shrinks after removals.
+
+        Raises:
+            ValueError: If the typecode is not supported by the array module.
+        """
+        _check_typecode(typecode)
+        self._setup(typecode, writer=True, growth_policy=growth_policy, shrink_policy=shrink_policy)
+        self._control = _create_shared_block(self.CONTROL.size)
+        self._data = self._create_block(initial_capacity)
+        self._capacity = initial_capacity
+        self._size = 0
+        self._map_elements()
+        self._publish()
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedDynamicArray":
+        """
+        Attaches to a shared array created by another process, as a read-only reader.
+
+        Args:
+            name (str): The name of the array, as reported by the writer's `name` attribute.
+
+        Returns:
+            SharedDynamicArray: A reader sharing the writer's memory.
+
+        Raises:
+            ValueError: If the block is not a shared dynamic array.
+        """
+        reader = cls.__new__(cls)
+        control = _attach_shared_block(name)
+        magic, typecode = cls.CONTROL.unpack_from(control.buf)[:2]
+        if magic != cls.MAGIC:
+            control.close()
+            raise ValueError(f"Shared memory block {name!r} is not a shared dynamic array.")
+        reader._setup(typecode.decode(), writer=False)
+        reader._control = control
+        reader._data = None
+        reader._capacity = 0
+        reader._refresh()
+        return reader
+
+    @classmethod
+    def load(cls, path: str, growth_policy=None, shrink_policy=None):
+        """
+        Not supported: shared arrays are created empty. Load the file with DynamicArray.load()
+        and extend() a SharedDynamicArray with it.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("SharedDynamicArray cannot load files. Use DynamicArray.load() and extend() a shared array with it.")
+
+    def _setup(self, typecode: str, writer: bool, growth_policy=None, shrink_policy=None):
+        """
+        Sets the attributes shared by writers and readers.
+        """
+        self.typecode = typecode
+        self._writer = writer
+        self._itemsize = array.array(typecode).itemsize
+        self._empty = self._allocate(1)[0]
+        self._value_index = None
+        self._stats = None
+        self._retired = []  # Mappings kept alive for views that outlived a resize attempt
+        self._generation = 0 if writer else -1  # Even generation last published or mapped (-1: nothing mapped yet)
+        self.array = memoryview(b"").cast(typecode)
+        self.growth_policy = growth_policy if growth_policy is not None else GrowthPolicy()
+        self.shrink_policy = shrink_policy if shrink_policy is not None else ShrinkPolicy()
+
+    @property
+    def name(self) -> str:
+        """
+        The name other processes pass to attach().
+        """
+        return self._control.name
+
+    @property
+    def size(self) -> int:
+        """
+        The number of published elements. Readers remap first if the writer has resized.
+        """
+        if self._writer:
+            return self._size
+        if self.SIZE.unpack_from(self._control.buf, self.GENERATION_OFFSET)[0] != self._generation:
+            self._refresh()
+        return min(self.SIZE.unpack_from(self._control.buf, self.SIZE_OFFSET)[0], self._capacity)
+
+    @size.setter
+    def size(self, value: int):
+        if not self._writer:
+            raise TypeError("Attached shared arrays are read-only. Only the creating process can modify them.")
+        self._size = value
+        self.SIZE.pack_into(self._control.buf, self.SIZE_OFFSET, value)  # Publish after the data is written
+
+    def _create_block(self, capacity: int) -> shared_memory.SharedMemory:
+        """
+        Creates a data block for `capacity` elements (shared blocks must be at least one byte).
+        """
+        return _create_shared_block(max(capacity * self._itemsize, 1))
+
+    def _map_elements(self):
+        """
+        Exposes the data block as a typed memoryview in self.array (read-only for readers).
+        """
+        elements = self._data.buf[:self._capacity * self._itemsize].cast(self.typecode)
+        self.array = elements if self._writer else elements.toreadonly()
+
+    def _publish(self):
+        """
+        Writes the metadata to the control block under the seqlock: the generation is odd while
+        the fields are being updated and even once they are consistent.
+        """
+        buf = self._control.buf
+        self._generation += 1  # Odd: readers retry
+        self.SIZE.pack_into(buf, self.GENERATION_OFFSET, self._generation)
+        self.CONTROL.pack_into(buf, 0, self.MAGIC, self.typecode.encode(), self._itemsize, self._size,
+                               self._capacity, self._generation, self._data.name.encode())
+        self._generation += 1  # Even: consistent
+        self.SIZE.pack_into(buf, self.GENERATION_OFFSET, self._generation)
+
+    def _refresh(self):
+        """
+        Re-reads the metadata and remaps the data block if the writer replaced it.
+
+        The writer unlinks a replaced block right after publishing its successor, so the block
+        named in a snapshot can vanish before the reader attaches. The reader then starts over
+        with a fresh snapshot, and it also retries if the generation moved while it attached.
+
+        Time Complexity: O(1), plus retries while the writer is resizing.
+        """
+        buf = self._control.buf
+        while True:
+            _, _, _, _, capacity, generation, data_name = self.CONTROL.unpack_from(buf)
+            if generation % 2 or self.SIZE.unpack_from(buf, self.GENERATION_OFFSET)[0] != generation:
+                time.sleep(0)  # The writer is publishing; wait for a consistent snapshot
+                continue
+            if generation == self._generation:
+                return
+            try:
+                data = _attach_shared_block(data_name.rstrip(b"\0").decode())
+            except FileNotFoundError:
+                continue  # Replaced and unlinked after the snapshot
+            if self.SIZE.unpack_from(buf, self.GENERATION_OFFSET)[0] == generation:
+                break
+            data.close()  # Replaced while attaching: the mapping may be a stale block
+        self.array.release()
+        if self._data is not None:
+            try:
+                self._data.close()
+            except BufferError:
+                self._retired.append(self._data)  # Views of the old block stay valid until released
+        self._data = data
+        self._capacity = capacity
+        self._generation = generation
+        self._map_elements()
+
+    def _open_block(self, name: str) -> shared_memory.SharedMemory:
+        """
+        Maps an existing data block: as its owner for the writer, without ownership for readers.
+        """
+        return shared_memory.SharedMemory(name=name) if self._writer else _attach_shared_block(name)
+
+    def _release_data(self) -> bool:
+        """
+        Releases this process's mapping of the data block if no view returned by view() is alive.
+
+        Returns:
+            bool: True if released. False if a view still exists; the views keep the old mapping
+            and the array continues through a fresh mapping of the same block.
+        """
+        self.array.release()
+        try:
+            self._data.close()  # Refuses to unmap while buffers are exported
+        except BufferError:
+            self._retired.append(self._data)  # Half-closed, but still mapped for the live views
+            self._data = self._open_block(self._data.name)
+            self._map_elements()
+            return False
+        return True
+
+    def _has_views(self) -> bool:
+        """
+        Checks whether a memoryview of the data block is still alive.
+
+        Time Complexity: O(1).
+        """
+        if not self._release_data():
+            return True
+        self._data = self._open_block(self._data.name)  # Remap the block we just unmapped
+        self._map_elements()
+        return False
+
+    def _resize(self, new_capacity: int):
+        """
+        Moves the elements into a new data block and publishes it to the readers.
+
+        Args:
+            new_capacity (int): The new capacity for the array.
+
+        Raises:
+            TypeError: If called on a reader.
+            BufferError: If a view returned by view() is still alive.
+
+        Time Complexity: O(n), where n is the number of elements in the array.
+        """
+        if not self._writer:
+            raise TypeError("Attached shared arrays are read-only. Only the creating process can modify them.")
+        new_data = self._create_block(new_capacity)
+        with new_data.buf[:new_capacity * self._itemsize].cast(self.typecode) as new_elements:
+            count = min(self._size, new_capacity)
+            new_elements[:count] = self.array[:count]
+        old_data = self._data
+        if not self._release_data():
+            new_data.close()
+            new_data.unlink()
+            raise BufferError("Cannot resize the array while views of it exist. Release them first.")
+        old_data.unlink()  # Readers keep their mapping until they remap
+        self._data = new_data
+        self._capacity = new_capacity
+        self._map_elements()
+        self._publish()
+
+    def close(self):
+        """
+        Detaches from the shared memory. The writer also destroys it, so call close() on the
+        writer only after the readers are done.
+
+        Raises:
+            BufferError: If a view returned by view() is still alive.
+        """
+        if self._control is None:
+            return
+        if not self._release_data():
+            raise BufferError("Cannot close the array while views of it exist. Release them first.")
+        for retired in self._retired:
+            retired.close()
+        self._retired = []
+        self._control.close()
+        if self._writer:
+            self._data.unlink()
+            self._control.unlink()
+        self._control = None
+
+    def view(self) -> memoryview:
+        """
+        Returns a zero-copy view of the elements, read-only for readers. The size is read before
+        self.array because, in a reader, reading it remaps self.array after a resize.
+
+        Returns:
+            memoryview: A view of the first `size` elements.
+
+        Time Complexity: O(1).
+        """
+        size = self.size
+        return self.array[:size]
+
+    def __iter__(self):
+        """
+        Iterates over a view taken when iteration starts, so a reader that remaps during the
+        loop keeps reading the block it started with.
+        """
+        return iter(self.view())
+
+    def __reduce__(self):
+        """
+        Pickles the array as its name, so worker processes attach to it instead of copying it.
+        """
+        return SharedDynamicArray.attach, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def shared_range_sum(shared_array: SharedDynamicArray, start: int, stop: int):
+    """
+    Sums a range of a shared array. Used by the example to show workers reading without copies.
+
+    Args:
+        shared_array (SharedDynamicArray): The array, attached in the worker when unpickled.
+        start (int): The first index to include.
+        stop (int): One past the last index to include.
+
+    Returns:
+        int | float: The sum of the elements in [start, stop).
+    """
+    try:
+        with shared_array.view() as elements:
+            return sum(elements[start:stop])
+    finally:
+        shared_array.close()
+
+
+def expected_copies_per_append(growth_policy, n: int) -> float:
+    """
+    Estimates the element copies per append that a growth policy implies for n appends, from
+    the closed forms rather than by replaying the policy.
+
+    Geometric growth by a factor f copies about 1 / (f - 1) elements per append: 1 when doubling
+    and 2 at 1.5x. The exact figure oscillates between 1 / (f - 1) and f / (f - 1) depending on
+    how full the last allocation is. Above a linear threshold T, growth by k slots adds copies of
+    T, T + k, ... up to n, about (n^2 - T^2) / (2k) in total, so the cost per append grows like
+    n / (2k) and is no longer O(1).
+
+    Args:
+        growth_policy (GrowthPolicy): The policy, read through its factor, linear_threshold and
+            linear_increment.
+        n (int): The number of appends.
+
+    Returns:
+        float: Estimated element copies per append.
+    """
+    geometric = 1 / (growth_policy.factor - 1)
+    threshold, increment = growth_policy.linear_threshold, growth_policy.linear_increment
+    if threshold is None or n <= threshold:
+        return geometric
+    copies = threshold * geometric + (n * n - threshold * threshold) / (2 * increment)
+    return copies / n
+
+
+def report_amortized_copy_cost(n: int = 100_000, policies: dict = None):
+    """
+    Appends n elements under several growth policies with statistics enabled and compares the
+    measured copy cost with the closed-form estimate of expected_copies_per_append().
+
+    Args:
+        n (int): The number of appends per policy. Default is 100,000.
+        policies (dict, optional): Growth policies keyed by a display name. Defaults to 2x, 1.5x
+            and doubling that turns linear (+4096 slots) above 4096.
+
+    Returns:
+        list[tuple]: One (name, measured, estimated, resizes, wasted_slots) row per policy.
+    """
+    if policies is None:
+        policies = {
+            "2x": GrowthPolicy(2.0),
+            "1.5x": GrowthPolicy(1.5),
+            "2x, +4096 above 4096": GrowthPolicy(2.0, linear_threshold=4096),
+        }
+    rows = []
+    for name, policy in policies.items():
+        dyn_array = DynamicArray(typecode='q', growth_policy=policy)
+        dyn_array.enable_stats()
+        for value in range(n):
+            dyn_array.append(value)
+        stats = dyn_array.stats()
+        rows.append((name, stats["amortized_copies_per_element"], expected_copies_per_append(policy, n),
+                     stats["resizes"], stats["wasted_slots"]))
+    return rows
+
+
+class ConcurrentDynamicArray:
+    """
+    A DynamicArray that many producer threads can append to without contending on one lock.
+
+    Each thread appends into its own buffer (a plain list, so no lock is needed). When a buffer
+    reaches `batch_size` elements, the thread takes the lock once and moves the whole batch into
+    the main storage with a single extend(). The lock is therefore taken once per batch instead
+    of once per element.
+
+    Ordering: elements from one thread keep their relative order. Elements from different threads
+    are interleaved batch by batch, in the order the batches were merged.
+
+    Readers call snapshot() for a consistent copy, or freeze() to stop all appends and read the
+    underlying DynamicArray directly. Both first merge every pending buffer, including the
+    buffers of threads that have already finished.
+    """
+
+    def __init__(self, typecode: str = None, batch_size: int = 1024):
+        """
+        Initializes an empty concurrent array.
+
+        Args:
+            typecode (str, optional): An array module typecode for the main storage. Default is None.
+            batch_size (int): Elements buffered per thread before a merge. Default is 1024.
+        """
+        self._storage = DynamicArray(typecode=typecode)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._buffers = []  # Every thread's buffer, so snapshot() can merge them all
+        self._frozen = False
+
+    def _buffer(self) -> list:
+        """
+        Returns the calling thread's buffer, creating and registering it on first use.
+        """
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = []
+            with self._lock:
+                self._buffers.append(buffer)
+            return buffer
+
+    def append(self, value: int):
+        """
+        Appends a value from any thread.
+
+        Args:
+            value (int): The value to append.
+
+        Raises:
+            ValueError: If the array has been frozen.
+
+        Time Complexity: O(1) amortized; the lock is taken once every `batch_size` appends.
+        """
+        if self._frozen:
+            raise ValueError("Cannot append to a frozen array.")
+        buffer = self._buffer()
+        buffer.append(value)
+        if len(buffer) >= self.batch_size:
+            with self._lock:
+                if self._frozen:  # freeze() ran after the check above; the frozen storage stays untouched
+                    del buffer[:]
+                    raise ValueError("Cannot append to a frozen array.")
+                self._merge(buffer)
+
+    def _merge_all(self):
+        """
+        Merges every thread's buffer into the main storage. The caller holds the lock.
+
+        Once the array is frozen, buffers only hold values from appends that raced with freeze(),
+        which are discarded instead.
+        """
+        for buffer in self._buffers:
+            if self._frozen:
+                del buffer[:]
+            else:
+                self._merge(buffer)
+
+    def _merge(self, buffer: list):
+        """
+        Moves the current contents of a buffer into the main storage. The caller holds the lock.
+
+        The prefix is copied and then deleted, each a single atomic list operation. The owning
+        thread only appends at the end, so values it adds during the merge are kept.
+        """
+        count = len(buffer)
+        if count:
+            self._storage.extend(buffer[:count])
+            del buffer[:count]
+
+    def flush(self):
+        """
+        Merges every thread's pending buffer into the main storage.
+
+        Time Complexity: O(p), where p is the number of pending elements.
+        """
+        with self._lock:
+            self._merge_all()
+
+    def snapshot(self) -> DynamicArray:
+        """
+        Returns a consistent copy of every element appended so far.
+
+        Returns:
+            DynamicArray: A compact copy, unaffected by later appends.
+
+        Time Complexity: O(n).
+        """
+        with self._lock:
+            self._merge_all()
+            return self._storage[:]
+
+    def freeze(self) -> DynamicArray:
+        """
+        Merges every pending buffer and stops further appends, returning the storage without copying.
+
+        Returns:
+            DynamicArray: The main storage. Appends that start after freeze() raise ValueError,
+            and values from appends that raced with it are discarded rather than merged.
+
+        Time Complexity: O(p), where p is the number of pending elements.
+        """
+        with self._lock:
+            self._merge_all()
+            self._frozen = True
+            return self._storage
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements, including those still waiting in thread buffers.
+        """
+        return self._storage.size + sum(len(buffer) for buffer in self._buffers)
+
+
+class LockedDynamicArray(DynamicArray):
+    """
+    A DynamicArray with one global lock around append. Used as the baseline in
+    benchmark_concurrent_appends().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def append(self, value: int):
+        """
+        Appends a value while holding the global lock.
+        """
+        with self._lock:
+            super().append(value)
+
+
+def benchmark_concurrent_appends(total: int = 1_600_000, thread_counts=(1, 4, 16), typecode: str = 'q'):
+    """
+    Measures append throughput with several producer threads, comparing one global lock with
+    per-thread batching.
+
+    Args:
+        total (int): The number of appends per run, split evenly across the threads. Default is 1,600,000.
+        thread_counts (tuple[int]): The producer thread counts to measure. Default is (1, 4, 16).
+        typecode (str): The typecode of the main storage. Default is 'q'.
+
+    Returns:
+        dict: Appends per second, keyed by (implementation name, thread count).
+    """
+    results = {}
+    for threads in thread_counts:
+        per_thread = total // threads
+        for name, factory in (("global lock", lambda: LockedDynamicArray(typecode=typecode)),
+                              ("batched", lambda: ConcurrentDynamicArray(typecode=typecode))):
+            target = factory()
+
+            def produce():
+                append = target.append
+                for value in range(per_thread):
+                    append(value)
+
+            workers = [threading.Thread(target=produce) for _ in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if isinstance(target, ConcurrentDynamicArray):
+                target.flush()
+            results[(name, threads)] = per_thread * threads / (time.perf_counter() - start)
+    return results
+
+
+class CircularDynamicArray(DynamicArray):
+    """
+    A dynamic array stored as a circular buffer, for queue and deque style workloads.
+
+    The live elements occupy `size` consecutive slots starting at `_head`, wrapping around the end
+    of the storage. Adding or removing at either end only moves the head or the tail, so append,
+    appendleft, pop and popleft are O(1) amortized instead of the O(n) shift that
+    DynamicArray.remove pays at the front. Indexed access stays O(1) with one modulo.
+
+    Resizing unwraps the elements so that the head is back at slot 0. Bulk operations inherited
+    from DynamicArray (insert_many, remove_if, remove_indices, view) first unwrap the buffer in
+    the same way, which is O(n) only when the live region actually wraps around.
+    """
+
+    def __init__(self, initial_capacity: int = 4, typecode: str = None, growth_policy=None, shrink_policy=None):
+        """
+        Initializes the circular dynamic array with a given capacity.
+
+        Args:
+            initial_capacity (int): The initial capacity of the buffer. Default is 4.
+            typecode (str, optional): An array module typecode for typed storage. Default is None.
+            growth_policy (GrowthPolicy, optional): How capacity grows when full. Defaults to doubling.
+            shrink_policy (ShrinkPolicy, optional): How capacity shrinks after removals.
+        """
+        super().__init__(initial_capacity, typecode, growth_policy, shrink_policy)
+        self._head = 0  # Physical slot of the first element
+
+    def append(self, value: int):
+        """
+        Adds a new element at the tail of the buffer.
+
+        Args:
+            value (int): The value to append.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.size == self._capacity:
+            self._resize(self.growth_policy.grow(self._capacity, self.size + 1))
+        self.array[(self._head + self.size) % self._capacity] = value
+        self.size += 1
+
+    def appendleft(self, value: int):
+        """
+        Adds a new element at the head of the buffer.
+
+        Args:
+            value (int): The value to prepend.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.size == self._capacity:
+            self._resize(self.growth_policy.grow(self._capacity, self.size + 1))
+        self._head = (self._head - 1) % self._capacity
+        self.array[self._head] = value
+        self.size += 1
+
+    def pop(self) -> int:
+        """
+        Removes and returns the element at the tail of the buffer.
+
+        Returns:
+            int: The last element.
+
+        Raises:
+            IndexError: If the buffer is empty.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.size == 0:
+            raise IndexError("pop from an empty array.")
+        tail = (self._head + self.size - 1) % self._capacity
+        value = self.array[tail]
+        self.array[tail] = self._empty
+        self.size -= 1
+        self._maybe_shrink()
+        return value
+
+    def popleft(self) -> int:
+        """
+        Removes and returns the element at the head of the buffer.
+
+        Returns:
+            int: The first element.
+
+        Raises:
+            IndexError: If the buffer is empty.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.size == 0:
+            raise IndexError("pop from an empty array.")
+        value = self.array[self._head]
+        self.array[self._head] = self._empty
+        self._head = (self._head + 1) % self._capacity
+        self.size -= 1
+        self._maybe_shrink()
+        return value
+
+    def access(self, index: int) -> int:
+        """
+        Accesses the element at the specified logical index.
+
+        Args:
+            index (int): The index of the element to access.
+
+        Returns:
+            int: The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        return self.array[(self._head + index) % self._capacity]
+
+    def _resize(self, new_capacity: int):
+        """
+        Resizes the buffer, unwrapping the elements so the head moves to slot 0.
+
+        Args:
+            new_capacity (int): The new capacity for the buffer.
+
+        Raises:
+            BufferError: If a view returned by view() is still alive.
+
+        Time Complexity: O(n), where n is the number of elements in the buffer.
+        """
+        if self._has_views():
+            raise BufferError("Cannot resize the array while views of it exist. Release them first.")
+        new_array = self._allocate(new_capacity)
+        first = min(self.size, self._capacity - self._head)  # Elements before the wrap point
+        new_array[:first] = self.array[self._head:self._head + first]
+        new_array[first:self.size] = self.array[:self.size - first]
+        self.array = new_array
+        self._capacity = new_capacity
+        self._head = 0
+
+    def _linearize(self):
+        """
+        Moves the head to slot 0 so the live elements are contiguous from the start of the storage.
+
+        Time Complexity: O(n) if the head is not already at slot 0, O(1) otherwise.
+        """
+        if self._head != 0:
+            self._resize(self._capacity)
+
+    def extend(self, iterable):
+        """
+        Appends every value from an iterable at the tail, resizing at most once.
+
+        Args:
+            iterable (iterable): The values to append.
+
+        Time Complexity: O(k), where k is the number of appended values (plus O(n) if a resize occurs).
+        """
+        items = self._as_storage(iterable)
+        count = len(items)
+        self._reserve(self.size + count)
+        tail = (self._head + self.size) % self._capacity if self._capacity else 0
+        first = min(count, self._capacity - tail)  # Values that fit before the wrap point
+        self.array[tail:tail + first] = items[:first]
+        self.array[:count - first] = items[first:]
+        self.size += count
+
+    def insert_many(self, index: int, items):
+        """
+        Inserts a sequence of values before the given logical index, unwrapping the buffer first.
+
+        Args:
+            index (int): The position of the first inserted value (0 <= index <= size).
+            items (iterable): The values to insert, in order.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(n + k), where k is the number of inserted values.
+        """
+        self._linearize()
+        super().insert_many(index, items)
+
+    def insert(self, index: int, value: int):
+        """
+        Inserts a value before the given logical index. Inserting at either end is O(1) amortized.
+
+        Args:
+            index (int): The position of the new value (0 <= index <= size).
+            value (int): The value to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1) amortized at the ends, O(n) in the middle.
+        """
+        if index == 0:
+            self.appendleft(value)
+        elif index == self.size:
+            self.append(value)
+        else:
+            self._linearize()
+            super().insert(index, value)
+
+    def remove(self, value: int):
+        """
+        Removes the first occurrence of the specified value, closing the gap from whichever end
+        is nearer.
+
+        Args:
+            value (int): The value to remove from the buffer.
+
+        Raises:
+            ValueError: If the value is not found in the buffer.
+
+        Time Complexity: O(n) to find the value, plus O(min(i, n - i)) to close the gap.
+        """
+        for i in range(self.size):
+            if self.array[(self._head + i) % self._capacity] == value:
+                self._shift_left(i)
+                self._maybe_shrink()
+                return
+        raise ValueError(f"Value {value} not found in the array.")
+
+    def _shift_left(self, index: int):
+        """
+        Removes the element at a logical index by shifting the shorter side of the buffer over it.
+
+        Args:
+            index (int): The logical index of the element to remove.
+
+        Time Complexity: O(min(index, n - index)).
+        """
+        capacity, head = self._capacity, self._head
+        if index < self.size // 2:
+            for i in range(index, 0, -1):  # Shift the front part one slot towards the tail
+                self.array[(head + i) % capacity] = self.array[(head + i - 1) % capacity]
+            self.array[head] = self._empty
+            self._head = (head + 1) % capacity
+        else:
+            for i in range(index, self.size - 1):  # Shift the back part one slot towards the head
+                self.array[(head + i) % capacity] = self.array[(head + i + 1) % capacity]
+            self.array[(head + self.size - 1) % capacity] = self._empty
+        self.size -= 1
+
+    def remove_if(self, predicate) -> int:
+        """
+        Removes every element for which the predicate returns True, unwrapping the buffer first.
+
+        Args:
+            predicate (callable): A function taking an element and returning True to remove it.
+
+        Returns:
+            int: The number of elements removed.
+
+        Time Complexity: O(n).
+        """
+        self._linearize()
+        return super().remove_if(predicate)
+
+    def remove_indices(self, indices) -> int:
+        """
+        Removes the elements at the given logical positions in one pass, unwrapping the buffer first.
+
+        Args:
+            indices (iterable[int]): The positions to remove.
+
+        Returns:
+            int: The number of elements removed.
+
+        Raises:
+            IndexError: If any index is out of range.
+
+        Time Complexity: O(n + k), where k is the number of indices.
+        """
+        self._linearize()
+        return super().remove_indices(indices)
+
+    def view(self) -> memoryview:
+        """
+        Returns a zero-copy memoryview over the live elements of a typed buffer, unwrapping the
+        buffer first if the elements currently wrap around the end of the storage.
+
+        Returns:
+            memoryview: A view of the live elements in logical order.
+
+        Raises:
+            TypeError: If the buffer uses untyped (list) storage.
+
+        Time Complexity: O(1), or O(n) when the buffer has to be unwrapped.
+        """
+        if self.typecode is None:
+            raise TypeError("Only typed arrays expose a buffer. Create the array with a typecode.")
+        if self._head + self.size > self._capacity:
+            self._linearize()
+        return memoryview(self.array)[self._head:self._head + self.size]
+
+    def __str__(self):
+        """
+        Returns a string representation of the buffer's elements in logical order.
+
+        Returns:
+            str: The string representation of the elements.
+        """
+        return str([self.array[(self._head + i) % self._capacity] for i in range(self.size)])
+
+    def __iter__(self):
+        """
+        Returns a lazy iterator over the elements in logical order, following the wrap-around.
+
+        Time Complexity: O(1) to create, O(n) to exhaust.
+        """
+        end = self._head + self.size
+        return itertools.chain(itertools.islice(self.array, self._head, min(end, self._capacity)),
+                               itertools.islice(self.array, max(end - self._capacity, 0)))
+
+    def __getitem__(self, index):
+        """
+        Returns the element at a logical index, or a compact copy of a slice.
+
+        Args:
+            index (int | slice): The index (negative values count from the end) or slice.
+
+        Returns:
+            int | DynamicArray: The element, or a new DynamicArray holding the sliced elements.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1) for an index, O(k) for a slice (plus O(n) if the buffer has to be unwrapped).
+        """
+        if isinstance(index, slice):
+            self._linearize()
+            return super().__getitem__(index)
+        return self.array[(self._head + self._normalize_index(index)) % self._capacity]
+
+    def __setitem__(self, index: int, value):
+        """
+        Replaces the element at a logical index.
+
+        Args:
+            index (int): The index (negative values count from the end).
+            value (int): The new value.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1).
+        """
+        self.array[(self._head + self._normalize_index(index)) % self._capacity] = value
+
+    def take(self, indices):
+        """
+        Gathers the elements at several logical indices into a new DynamicArray.
+
+        Args:
+            indices (iterable[int]): The indices to gather (negative values count from the end).
+
+        Returns:
+            DynamicArray: A new array holding the gathered elements, in the order given.
+
+        Raises:
+            IndexError: If any index is out of range.
+
+        Time Complexity: O(k), plus O(n) if the buffer has to be unwrapped.
+        """
+        self._linearize()
+        return super().take(indices)
+
+    def enable_index(self, lazy: bool = False):
+        """
+        Not supported: appendleft and popleft renumber every element, so a position index would
+        need O(n) maintenance on the operations this class exists to make O(1).
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("CircularDynamicArray does not support the value index.")
+
+    def print_memory(self):
+        """
+        Prints the physical layout of the buffer, marking the slot that holds the head.
+
+        Example:
+            Memory Layout: [30] [None] (10) [20]
+        """
+        grid = []
+        for i in range(self._capacity):
+            live = (i - self._head) % self._capacity < self.size
+            cell = str(self.array[i]) if live else "None"
+            grid.append(f"({cell})" if i == self._head and live else f"[{cell}]")
+        print("Memory Layout:", " ".join(grid))
+
+
+class BlockedDynamicArray:
+    """
+    A dynamic array split into a list of small blocks (a "rope of blocks") for fast positional edits.
+
+    Inserting into or removing from the middle of a flat DynamicArray shifts every later element.
+    Here each block holds at most `2 * block_size` elements, so an edit only shifts elements inside
+    one block. A Fenwick tree (binary indexed tree) over the block lengths finds the block that
+    holds a given index, and is updated when a block length changes.
+
+    Complexity (n elements, B = n / block_size blocks):
+    - access(index): O(log B) to locate the block, then O(1).
+    - insert(index, value) / delete(index): O(block_size + log B).
+    - append: O(log B) amortized.
+    - Splitting a full block or dropping an empty one rebuilds the Fenwick tree in O(B). This
+      happens at most once every block_size edits, so it is O(1) amortized for block_size >= B.
+
+    Blocks are Python lists, or array.array objects when a typecode is given.
+    """
+
+    def __init__(self, block_size: int = 512, typecode: str = None):
+        """
+        Initializes an empty blocked array.
+
+        Args:
+            block_size (int): The target number of elements per block. Default is 512.
+            typecode (str, optional): An array module typecode for typed blocks. Default is None.
+
+        Raises:
+            ValueError: If the block size is not positive or the typecode is unsupported.
+        """
+        if block_size < 1:
+            raise ValueError("Block size must be positive.")
+        if typecode is not None:
+            _check_typecode(typecode)
+        self.block_size = block_size
+        self.typecode = typecode
+        self._blocks = []  # Non-empty blocks, in order (the last one may be empty right after creation)
+        self._tree = [0]  # Fenwick tree over the block lengths (1-based)
+        self.size = 0
+
+    def _new_block(self, values=()):
+        """
+        Creates a block in the storage format of this array.
+        """
+        return list(values) if self.typecode is None else array.array(self.typecode, values)
+
+    def _rebuild_index(self):
+        """
+        Rebuilds the Fenwick tree after blocks were split or dropped.
+
+        Time Complexity: O(B), where B is the number of blocks.
+        """
+        tree = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update_index(self, block_index: int, delta: int):
+        """
+        Adds `delta` to the length recorded for one block.
+
+        Time Complexity: O(log B).
+        """
+        tree = self._tree
+        i = block_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int):
+        """
+        Finds the block holding a logical index.
+
+        Args:
+            index (int): A logical index with 0 <= index < size.
+
+        Returns:
+            tuple[int, int]: The block index and the offset inside that block.
+
+        Time Complexity: O(log B).
+        """
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            candidate = position + step
+            if candidate < len(tree) and tree[candidate] <= index:
+                position = candidate
+                index -= tree[candidate]
+            step >>= 1
+        return position, index
+
+    def append(self, value: int):
+        """
+        Adds a new element at the end of the array.
+
+        Args:
+            value (int): The value to append.
+
+        Time Complexity: O(log B) amortized.
+        """
+        if not self._blocks or len(self._blocks[-1]) >= self.block_size:
+            self._blocks.append(self._new_block())
+            i = len(self._blocks)  # Fenwick position of the new block; its node covers (i - lowbit(i), i]
+            self._tree.append(sum(len(block) for block in self._blocks[i - (i & -i):i]))
+        self._blocks[-1].append(value)
+        self._update_index(len(self._blocks) - 1, 1)
+        self.size += 1
+
+    def insert(self, index: int, value: int):
+        """
+        Inserts a value before the given index.
+
+        Args:
+            index (int): The position of the new value (0 <= index <= size).
+            value (int): The value to insert.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(block_size + log B), plus an O(B) index rebuild when a block splits.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range.")
+        if index == self.size:
+            self.append(value)
+            return
+        block_index, offset = self._locate(index)
+        block = self._blocks[block_index]
+        block.insert(offset, value)
+        self.size += 1
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2  # Split the overfull block in two
+            self._blocks[block_index:block_index + 1] = [block[:half], block[half:]]
+            self._rebuild_index()
+        else:
+            self._update_index(block_index, 1)
+
+    def _delete(self, block_index: int, offset: int):
+        """
+        Deletes one element from a block, dropping the block if it becomes empty.
+
+        Time Complexity: O(block_size + log B), plus O(B) when a block is dropped.
+        """
+        block = self._blocks[block_index]
+        del block[offset]
+        self.size -= 1
+        if block:
+            self._update_index(block_index, -1)
+        else:
+            del self._blocks[block_index]
+            self._rebuild_index()
+
+    def remove(self, value: int):
+        """
+        Removes the first occurrence of the specified value from the array.
+
+        Args:
+            value (int): The value to remove.
+
+        Raises:
+            ValueError: If the value is not found in the array.
+
+        Time Complexity: O(n) to find the value, then O(block_size + log B) to delete it.
+        """
+        for block_index, block in enumerate(self._blocks):
+            try:
+                offset = block.index(value)  # Scans the block in C
+            except ValueError:
+                continue
+            self._delete(block_index, offset)
+            return
+        raise ValueError(f"Value {value} not found in the array.")
+
+    def delete(self, index: int):
+        """
+        Removes the element at the given index.
+
+        Args:
+            index (int): The position of the element to remove.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(block_size + log B).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        self._delete(*self._locate(index))
+
+    def access(self, index: int) -> int:
+        """
+        Accesses the element at the specified index.
+
+        Args:
+            index (int): The index of the element to access.
+
+        Returns:
+            int: The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(log B).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        block_index, offset = self._locate(index)
+        return self._blocks[block_index][offset]
+
+    def __str__(self):
+        """
+        Returns a string representation of the array's elements.
+
+        Returns:
+            str: The string representation of the array's elements.
+        """
+        return str([value for block in self._blocks for value in block])
+
+    def print_blocks(self):
+        """
+        Prints the elements of each block, to visualize how the array is split.
+
+        Example:
+            Blocks: [10, 20] [25, 30] [40]
+        """
+        print("Blocks:", " ".join(str(list(block)) for block in self._blocks))
+
+
+def benchmark_positional_edits(n: int = 100_000, edits: int = 2_000, typecode: str = 'q'):
+    """
+    Times random middle inserts and indexed reads on a flat DynamicArray and a BlockedDynamicArray.
+
+    Args:
+        n (int): The number of elements loaded before the edits. Default is 100,000.
+        edits (int): The number of inserts and reads to time. Default is 2,000.
+        typecode (str): The typecode used for both arrays. Default is 'q'.
+
+    Returns:
+        dict: Seconds spent per structure, keyed by 'flat' and 'blocked', each a dict with
+        'inserts' and 'reads' timings.
+    """
+    import random
+    rng = random.Random(0)
+    positions = [rng.randrange(n) for _ in range(edits)]
+    flat = DynamicArray.from_iterable(range(n), typecode=typecode)
+    blocked = BlockedDynamicArray(typecode=typecode)
+    for value in range(n):
+        blocked.append(value)
+
+    results = {}
+    for name, structure in (("flat", flat), ("blocked", blocked)):
+        start = time.perf_counter()
+        for index in positions:
+            structure.insert(index, -1)
+        insert_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for index in positions:
+            structure.access(index)
+        results[name] = {"inserts": insert_time, "reads": time.perf_counter() - start}
+    return results
+
+
+class PersistentVector:
+    """
+    An immutable array whose updates return new versions that share structure with the old ones.
+
+    The elements live in a 32-way trie plus a "tail" list holding the last (up to 32) elements.
+    Updating one element copies only the nodes on the path from the root to its leaf (at most
+    log32(n) nodes of 32 slots), and every other node is shared with the previous version. So
+    keeping many versions for rollback or diffing costs memory proportional to the changes, not
+    to the array size. Taking a snapshot is O(1): a version is never modified, so the snapshot is
+    just a reference to it.
+
+    Complexity:
+    - access(index): O(log32 n), effectively constant (7 levels cover 34 billion elements).
+    - set, append, pop: O(log32 n), each returning a new vector.
+    - Appends and pops touch only the tail 31 times out of 32.
+
+    The read API matches DynamicArray: size, access(), len(), iteration, `in`, indexing and slicing.
+    """
+
+    BITS = 5
+    WIDTH = 1 << BITS  # 32 children per node
+    MASK = WIDTH - 1
+
+    def __init__(self, size: int = 0, shift: int = BITS, root: list = None, tail: list = None):
+        """
+        Creates a vector from its internal parts. Use PersistentVector() for an empty vector or
+        PersistentVector.from_iterable() to build one from values.
+
+        Args:
+            size (int): The number of elements.
+            shift (int): BITS times the height of the trie (BITS for a root whose children are leaves).
+            root (list, optional): The root node of the trie. Defaults to an empty node.
+            tail (list, optional): The last elements, not yet pushed into the trie. Defaults to empty.
+        """
+        self.size = size
+        self._shift = shift
+        self._root = root if root is not None else []
+        self._tail = tail if tail is not None else []
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "PersistentVector":
+        """
+        Builds a vector bottom-up from values, without creating the intermediate versions.
+
+        Args:
+            iterable (iterable): The initial values.
+
+        Returns:
+            PersistentVector: A vector holding the values.
+
+        Time Complexity: O(n).
+        """
+        values = list(iterable)
+        size = len(values)
+        tail_start = cls._tail_offset_for(size)
+        nodes = [values[i:i + cls.WIDTH] for i in range(0, tail_start, cls.WIDTH)]  # Leaves
+        shift = cls.BITS
+        while len(nodes) > cls.WIDTH:
+            nodes = [nodes[i:i + cls.WIDTH] for i in range(0, len(nodes), cls.WIDTH)]
+            shift += cls.BITS
+        return cls(size, shift, nodes, values[tail_start:])
+
+    @classmethod
+    def _tail_offset_for(cls, size: int) -> int:
+        """
+        Returns the index of the first element stored in the tail for a vector of `size` elements.
+        """
+        return 0 if size < cls.WIDTH else ((size - 1) >> cls.BITS) << cls.BITS
+
+    def _leaf_for(self, index: int) -> list:
+        """
+        Returns the leaf (or the tail) that holds the element at a valid index.
+
+        Time Complexity: O(log32 n).
+        """
+        if index >= self._tail_offset_for(self.size):
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -self.BITS):
+            node = node[(index >> level) & self.MASK]
+        return node
+
+    def access(self, index: int):
+        """
+        Accesses the element at the specified index.
+
+        Args:
+            index (int): The index of the element to access.
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(log32 n).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        return self._leaf_for(index)[index & self.MASK]
+
+    def append(self, value) -> "PersistentVector":
+        """
+        Returns a new vector with the value added at the end. This vector is unchanged.
+
+        Args:
+            value: The value to append.
+
+        Returns:
+            PersistentVector: The new version.
+
+        Time Complexity: O(log32 n); O(1) except once every 32 appends.
+        """
+        if self.size - self._tail_offset_for(self.size) < self.WIDTH:
+            return PersistentVector(self.size + 1, self._shift, self._root, self._tail + [value])
+        # The tail is full: push it into the trie and start a new tail
+        if (self.size >> self.BITS) > (1 << self._shift):  # The trie is full: add a level on top
+            root = [self._root, self._new_path(self._shift, self._tail)]
+            shift = self._shift + self.BITS
+        else:
+            root = self._push_tail(self._shift, self._root, self._tail)
+            shift = self._shift
+        return PersistentVector(self.size + 1, shift, root, [value])
+
+    def _new_path(self, level: int, node: list) -> list:
+        """
+        Wraps a leaf in single-child nodes until it reaches the given level.
+        """
+        for _ in range(0, level, self.BITS):
+            node = [node]
+        return node
+
+    def _push_tail(self, level: int, parent: list, tail: list) -> list:
+        """
+        Returns a copy of `parent` with the full tail added as the rightmost leaf below it.
+        """
+        sub_index = ((self.size - 1) >> level) & self.MASK
+        node = list(parent)
+        if level == self.BITS:
+            child = tail
+        elif sub_index < len(parent):
+            child = self._push_tail(level - self.BITS, parent[sub_index], tail)
+        else:
+            child = self._new_path(level - self.BITS, tail)
+        if sub_index == len(node):
+            node.append(child)
+        else:
+            node[sub_index] = child
+        return node
+
+    def set(self, index: int, value) -> "PersistentVector":
+        """
+        Returns a new vector with the element at an index replaced. This vector is unchanged.
+
+        Args:
+            index (int): The index to replace (index == size appends instead).
+            value: The new value.
+
+        Returns:
+            PersistentVector: The new version.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(log32 n); only the nodes on the path to the element are copied.
+        """
+        if index == self.size:
+            return self.append(value)
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of range.")
+        if index >= self._tail_offset_for(self.size):
+            tail = list(self._tail)
+            tail[index & self.MASK] = value
+            return PersistentVector(self.size, self._shift, self._root, tail)
+        return PersistentVector(self.size, self._shift, self._assoc(self._shift, self._root, index, value), self._tail)
+
+    def _assoc(self, level: int, node: list, index: int, value) -> list:
+        """
+        Returns a copy of the path from `node` down to the element at `index`, with the value replaced.
+        """
+        node = list(node)
+        if level == 0:
+            node[index & self.MASK] = value
+        else:
+            sub_index = (index >> level) & self.MASK
+            node[sub_index] = self._assoc(level - self.BITS, node[sub_index], index, value)
+        return node
+
+    def pop(self) -> "PersistentVector":
+        """
+        Returns a new vector without its last element. This vector is unchanged.
+
+        Returns:
+            PersistentVector: The new version.
+
+        Raises:
+            IndexError: If the vector is empty.
+
+        Time Complexity: O(log32 n); O(1) except once every 32 pops.
+        """
+        if self.size == 0:
+            raise IndexError("pop from an empty vector.")
+        if self.size == 1:
+            return PersistentVector()
+        if self.size - self._tail_offset_for(self.size) > 1:
+            return PersistentVector(self.size - 1, self._shift, self._root, self._tail[:-1])
+        # The tail becomes empty: the rightmost leaf of the trie becomes the new tail
+        tail = self._leaf_for(self.size - 2)
+        root = self._pop_tail(self._shift, self._root)
+        shift = self._shift
+        if root is None:
+            root = []
+        if shift > self.BITS and len(root) == 1:  # Drop a level that has a single child
+            root = root[0]
+            shift -= self.BITS
+        return PersistentVector(self.size - 1, shift, root, tail)
+
+    def _pop_tail(self, level: int, node: list):
+        """
+        Returns a copy of `node` without its rightmost leaf, or None if nothing would remain.
+        """
+        sub_index = ((self.size - 2) >> level) & self.MASK
+        if level > self.BITS:
+            child = self._pop_tail(level - self.BITS, node[sub_index])
+            if child is None and sub_index == 0:
+                return None
+            return node[:sub_index] + ([child] if child is not None else [])
+        if sub_index == 0:
+            return None
+        return node[:sub_index]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the vector.
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Returns a lazy iterator over the elements, walking one leaf at a time.
+
+        Time Complexity: O(n) to exhaust; each leaf is located once, not once per element.
+        """
+        for start in range(0, self.size, self.WIDTH):
+            yield from self._leaf_for(start)
+
+    def __contains__(self, value) -> bool:
+        """
+        Checks whether the value is stored in the vector.
+
+        Time Complexity: O(n).
+        """
+        return value in iter(self)
+
+    def __getitem__(self, index):
+        """
+        Returns the element at an index, or a new vector holding a slice.
+
+        Args:
+            index (int | slice): The index (negative values count from the end) or slice.
+
+        Returns:
+            The element, or a PersistentVector with the sliced elements.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return PersistentVector.from_iterable(self.access(i) for i in range(*index.indices(self.size)))
+        if index < 0:
+            index += self.size
+        return self.access(index)
+
+    def __str__(self):
+        """
+        Returns a string representation of the vector's elements.
+        """
+        return str(list(self))
+
+
+def _popcount(value: int) -> int:
+    """
+    Counts the set bits of a non-negative integer (int.bit_count on Python 3.10+).
+    """
+    return value.bit_count() if hasattr(value, "bit_count") else bin(value).count("1")
+
+
+class BitDynamicArray:
+    """
+    A dynamic array of booleans packed 8 per byte in a bytearray, for large flag vectors.
+
+    A list-based DynamicArray spends an 8-byte pointer on every flag. Here a flag costs one bit,
+    a 64x reduction. Bit i lives in byte i // 8 at bit position i % 8 (least significant bit
+    first). Bits past `size` are always kept at 0, which lets the bulk operations work on whole
+    bytes.
+
+    The bulk operations (count, any, all, find_first, remove) convert the packed bytes into one
+    Python integer with int.from_bytes and use integer arithmetic on it. CPython then processes
+    the bits one machine word at a time in C, instead of one Python object per flag.
+    """
+
+    def __init__(self, initial_capacity: int = 64):
+        """
+        Initializes an empty bit array.
+
+        Args:
+            initial_capacity (int): The initial capacity in bits, rounded up to whole bytes. Default is 64.
+        """
+        self.bits = bytearray((initial_capacity + 7) // 8)
+        self.size = 0
+
+    def capacity(self) -> int:
+        """
+        Returns the current capacity of the array, in bits.
+        """
+        return len(self.bits) * 8
+
+    def _resize(self, new_capacity: int):
+        """
+        Resizes the byte buffer to hold `new_capacity` bits, preserving the existing bits.
+
+        Time Complexity: O(n / 8).
+        """
+        new_bits = bytearray((new_capacity + 7) // 8)
+        used = (self.size + 7) // 8
+        new_bits[:used] = self.bits[:used]
+        self.bits = new_bits
+
+    def _as_int(self) -> int:
+        """
+        Returns the live bits as one integer, with bit i of the array at bit i of the integer.
+
+        Time Complexity: O(n / 8), in C.
+        """
+        with memoryview(self.bits) as data:
+            return int.from_bytes(data[:(self.size + 7) // 8], "little")
+
+    def append(self, value: bool):
+        """
+        Adds a new flag at the end of the array, doubling the buffer if it is full.
+
+        Args:
+            value (bool): The flag to append.
+
+        Time Complexity: O(1) amortized.
+        """
+        if self.size == self.capacity():
+            self._resize(max(self.capacity() * 2, 8))
+        if value:
+            self.bits[self.size >> 3] |= 1 << (self.size & 7)
+        self.size += 1
+
+    def access(self, index: int) -> bool:
+        """
+        Accesses the flag at the specified index.
+
+        Args:
+            index (int): The index of the flag.
+
+        Returns:
+            bool: The flag.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def set(self, index: int, value: bool):
+        """
+        Sets the flag at the specified index.
+
+        Args:
+            index (int): The index of the flag.
+            value (bool): The new flag.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index out of range.")
+        if value:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def remove(self, value: bool):
+        """
+        Removes the first occurrence of the flag, shifting every later flag down by one bit.
+
+        Args:
+            value (bool): The flag to remove.
+
+        Raises:
+            ValueError: If the flag is not found in the array.
+
+        Time Complexity: O(n / 8), as one integer shift over the bytes from the removed bit onwards.
+        """
+        index = self.find_first(value)
+        if index < 0:
+            raise ValueError(f"Value {value} not found in the array.")
+        start, end = index >> 3, (self.size + 7) // 8
+        offset = index & 7
+        tail = int.from_bytes(self.bits[start:end], "little")
+        tail = (tail & ((1 << offset) - 1)) | (tail >> (offset + 1) << offset)  # Drop one bit
+        self.bits[start:end] = tail.to_bytes(end - start, "little")
+        self.size -= 1
+
+    def count(self, value: bool = True) -> int:
+        """
+        Counts the flags equal to the given value.
+
+        Args:
+            value (bool): The flag to count. Default is True.
+
+        Returns:
+            int: The number of matching flags.
+
+        Time Complexity: O(n / 8), as one population count in C.
+        """
+        ones = _popcount(self._as_int())
+        return ones if value else self.size - ones
+
+    def any(self) -> bool:
+        """
+        Returns True if at least one flag is set.
+
+        Time Complexity: O(n / 8).
+        """
+        return self._as_int() != 0
+
+    def all(self) -> bool:
+        """
+        Returns True if every flag is set (True for an empty array).
+
+        Time Complexity: O(n / 8).
+        """
+        return self._as_int() == (1 << self.size) - 1
+
+    def find_first(self, value: bool = True) -> int:
+        """
+        Returns the index of the first flag equal to the given value.
+
+        Args:
+            value (bool): The flag to look for. Default is True.
+
+        Returns:
+            int: The index of the first match, or -1 if there is none.
+
+        Time Complexity: O(n / 8).
+        """
+        bits = self._as_int()
+        if not value:
+            bits ^= (1 << self.size) - 1  # Flip the live bits so the first clear flag becomes set
+        if bits == 0:
+            return -1
+        return (bits & -bits).bit_length() - 1  # Position of the lowest set bit
+
+    def __len__(self) -> int:
+        """
+        Returns the number of flags in the array.
+        """
+        return self.size
+
+    def __str__(self):
+        """
+        Returns a string representation of the flags.
+
+        Example:
+            [True, False, True]
+        """
+        return str([self.access(i) for i in range(self.size)])
+
+    def print_memory(self):
+        """
+        Prints the bytes of the buffer in binary, with bit 0 of each byte on the left.
+
+        Example:
+            Memory Layout: [10100000] [00000000]
+        """
+        print("Memory Layout:", " ".join(f"[{format(byte, '08b')[::-1]}]" for byte in self.bits))
+
+# Example usage
+if __name__ == "__main__":
+    # Initialize a dynamic array
+    dyn_array = DynamicArray(initial_capacity=4)
+
+    # Append elements
+    dyn_array.append(10)
+    dyn_array.append(20)
+    dyn_array.append(30)
     dyn_array.append(40)
 
     # Print the array
@@ -173,4 +3474,166 @@ if __name__ == "__main__":
     print("Current capacity:", dyn_array.capacity())  # Output: 8
 
     # Printing the memory 
-    dyn_array.print_memory()
\ No newline at end of file
+    dyn_array.print_memory()
+
+    # Typed storage: 8-byte signed integers stored unboxed in an array.array
+    typed_array = DynamicArray(initial_capacity=2, typecode='q')
+    for value in (7, 14, 21):
+        typed_array.append(value)
+    typed_array.remove(14)
+    print("Typed array:", typed_array)  # Output: [7, 21]
+    print("Bytes per element:", typed_array.itemsize)  # Output: 8
+    typed_array.print_memory()
+
+    # Bulk loading: one allocation and one slice copy instead of one append per element
+    bulk_array = DynamicArray.from_iterable(range(5), typecode='q')
+    bulk_array.extend([5, 6, 7])
+    bulk_array.insert_many(1, [100, 200])
+    print("Bulk-loaded array:", bulk_array)  # Output: [0, 100, 200, 1, 2, 3, 4, 5, 6, 7]
+    print("Capacity after bulk load:", bulk_array.capacity())  # Output: 10
+
+    # Batched removal: one compaction pass and at most one shrink
+    removed = bulk_array.remove_if(lambda value: value % 2 == 1)
+    print("Removed odd values:", removed)  # Output: 4
+    print("Array after remove_if:", bulk_array)  # Output: [0, 100, 200, 2, 4, 6]
+    bulk_array.remove_indices([1, 2])
+    print("Array after remove_indices:", bulk_array)  # Output: [0, 2, 4, 6]
+
+    # Growth and shrink policies: grow by 1.5x, give memory back once occupancy drops below 25%
+    policy_array = DynamicArray(growth_policy=GrowthPolicy(factor=1.5), shrink_policy=ShrinkPolicy(threshold=0.25))
+    policy_array.extend(range(40))
+    print("Capacity after load spike:", policy_array.capacity())  # Output: 40
+    policy_array.remove_if(lambda value: value >= 5)
+    print("Capacity after eviction:", policy_array.capacity())  # Output: 20
+    policy_array.shrink_to_fit()
+    print("Capacity after shrink_to_fit:", policy_array.capacity())  # Output: 5
+
+    # Sequence protocol: no intermediate lists
+    print("Length:", len(bulk_array), "| 4 in array:", 4 in bulk_array)  # Output: Length: 4 | 4 in array: True
+    print("Last element:", bulk_array[-1], "| Reversed slice:", bulk_array[::-1])  # Output: 6 | [6, 4, 2, 0]
+    bulk_array[0] = 1
+    print("Sum via iteration:", sum(bulk_array))  # Output: 13
+    print("Gathered:", bulk_array.take([3, 0, 3]))  # Output: [6, 1, 6]
+
+    # Binary snapshots: one write to save, one readinto to load
+    import tempfile
+    snapshot_path = os.path.join(tempfile.mkdtemp(), "checkpoint.dynarr")
+    bulk_array.save(snapshot_path)
+    restored_array = DynamicArray.load(snapshot_path)
+    print("Restored from checkpoint:", restored_array, "capacity", restored_array.capacity())  # Output: [1, 2, 4, 6] capacity 10
+    os.remove(snapshot_path)
+
+    # Value index: membership, lookup and removal by value without scanning
+    ids = DynamicArray.from_iterable(range(1000, 1010))
+    ids.enable_index()
+    ids.remove(1003)
+    print("index_of(1007):", ids.index_of(1007), "| 1003 in ids:", 1003 in ids)  # Output: 6 | False
+    print("Index memory:", ids.index_memory(), "bytes for", len(ids), "elements")
+
+    # Zero-copy export of typed storage
+    with bulk_array.view() as data:
+        print("View as bytes:", len(data.tobytes()), "bytes")  # Output: 32 bytes
+        print("Unpacked with struct:", struct.unpack(f"{len(data)}q", data))  # Output: (1, 2, 4, 6)
+
+    # Bulk operations: vectorized with NumPy when it is installed, pure Python otherwise
+    readings = DynamicArray.from_iterable([12, 7, 15, 3, 9], typecode='q')
+    print("Backend:", "NumPy" if np is not None else "pure Python")
+    print("Sum:", readings.reduce(operator.add), "| max:", readings.reduce(max), "| argmin:", readings.argmin())  # Output: Sum: 46 | max: 15 | argmin: 3
+    print("Scaled:", readings.map_vectorized(lambda x: x * 10))  # Output: [120, 70, 150, 30, 90]
+    print("Above 8:", readings.filter_vectorized(lambda x: x > 8))  # Output: [12, 15, 9]
+    print("Clipped:", readings.map(lambda x: x if x < 10 else 10))  # Output: [10, 7, 10, 3, 9]
+    print("Running total:", readings.cumsum())  # Output: [12, 19, 34, 37, 46]
+    print("Normalized:", (readings - 3) / 12)  # Output: [0.75, 0.333..., 1.0, 0.0, 0.5]
+    small = DynamicArray.from_iterable([100, 27], typecode='b')
+    print("int8 + uint8:", small + DynamicArray.from_iterable([200, 1], typecode='B'))  # Output: [300, 28]
+    try:
+        small + small
+    except OverflowError:
+        print("int8 + int8 overflows: OverflowError")  # Same with and without NumPy
+
+    # File-backed array: survives restarts and can grow beyond RAM
+    mapped_path = os.path.join(tempfile.mkdtemp(), "ids.dynarr")
+    with MappedDynamicArray(mapped_path, typecode='q') as mapped_array:
+        mapped_array.extend(range(1, 7))
+        mapped_array.remove(3)
+    with MappedDynamicArray(mapped_path, typecode='q') as reopened_array:
+        print("Reopened mapped array:", reopened_array)  # Output: [1, 2, 4, 5, 6]
+        print("Recovered capacity:", reopened_array.capacity())  # Output: 8
+    os.remove(mapped_path)
+
+    # Shared-memory array: worker processes attach by name instead of receiving a pickled copy
+    from multiprocessing import Pool
+    with SharedDynamicArray(typecode='q') as shared_array:
+        shared_array.extend(range(1, 101))
+        with Pool(2) as pool:
+            partial_sums = pool.starmap(shared_range_sum, [(shared_array, 0, 50), (shared_array, 50, 100)])
+        print("Sum computed by workers:", sum(partial_sums))  # Output: 5050
+    with SharedDynamicArray(typecode='q') as writer:
+        writer.extend(range(4))
+        reader = SharedDynamicArray.attach(writer.name)
+        writer.extend(range(4, 20))  # Resizes: the reader remaps on its next read
+        print("Reader after resize:", list(reader)[-3:], len(reader.view()))  # Output: [17, 18, 19] 20
+        reader.close()
+
+    # Concurrent appends: each producer thread fills its own buffer and merges it in batches
+    concurrent_array = ConcurrentDynamicArray(typecode='q', batch_size=64)
+    producers = [threading.Thread(target=lambda: [concurrent_array.append(v) for v in range(1000)]) for _ in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    print("Elements after 4 producers:", len(concurrent_array.freeze()))  # Output: 4000
+    for (name, threads), rate in benchmark_concurrent_appends(total=400_000).items():
+        print(f"{name:>12}, {threads:>2} threads: {rate / 1e6:.2f}M appends/s")
+
+    # Instrumentation: check the amortized O(1) append claim on a real workload
+    resize_log = []
+    stats_array = DynamicArray(typecode='q')
+    stats_array.enable_stats(on_resize=lambda old, new, size: resize_log.append((old, new)))
+    stats_array.extend(range(10))
+    for value in range(10, 40):
+        stats_array.append(value)
+    print("Resizes:", resize_log)  # Output: [(4, 10), (10, 20), (20, 40)]
+    print("Stats:", {key: value for key, value in stats_array.stats().items() if key != "occupancy_histogram"})
+    for name, measured, estimated, resizes, wasted in report_amortized_copy_cost(n=100_000):
+        print(f"{name:>22}: {measured:.3f} copies/append measured, {estimated:.3f} closed form, "
+              f"{resizes} resizes, {wasted} wasted slots")
+
+    # Bit-packed flags: one bit per flag, bulk operations over whole bytes
+    flags = BitDynamicArray(initial_capacity=8)
+    for flag in (False, False, True, False, True, True, False, True, True):
+        flags.append(flag)
+    flags.set(0, True)
+    flags.remove(False)
+    print("Flags:", flags)  # Output: [True, True, False, True, True, False, True, True]
+    print("Set:", flags.count(), "| first clear:", flags.find_first(False), "| any:", flags.any(), "| all:", flags.all())  # Output: Set: 6 | first clear: 2 | any: True | all: False
+    flags.print_memory()  # Output: Memory Layout: [11011011] [00000000]
+
+    # Persistent vector: every update returns a new version and old versions stay valid
+    version_1 = PersistentVector.from_iterable(range(100))
+    version_2 = version_1.set(50, -1).append(100)
+    version_3 = version_2.pop().pop()
+    print("Versions:", version_1.access(50), version_2.access(50), len(version_2), len(version_3))  # Output: 50 -1 101 99
+
+    # Circular buffer: O(1) work-queue operations at both ends
+    queue = CircularDynamicArray(initial_capacity=4)
+    queue.extend([10, 20, 30])
+    print("Dequeued:", queue.popleft())  # Output: 10
+    queue.append(40)
+    queue.append(50)  # Wraps around to the slot freed by popleft
+    queue.print_memory()  # Output: Memory Layout: [50] (20) [30] [40]
+    queue.appendleft(5)  # Buffer is full, so it unwraps into a larger one
+    print("Queue:", queue, "at index 1:", queue.access(1))  # Output: [5, 20, 30, 40, 50] at index 1: 20
+    print("Popped from tail:", queue.pop())  # Output: 50
+
+    # Blocked array: positional edits only shift elements inside one block
+    blocked_array = BlockedDynamicArray(block_size=2)
+    for value in (10, 20, 30, 40):
+        blocked_array.append(value)
+    blocked_array.insert(2, 25)
+    blocked_array.remove(20)
+    print("Blocked array:", blocked_array, "at index 2:", blocked_array.access(2))  # Output: [10, 25, 30, 40] at index 2: 30
+    blocked_array.print_blocks()  # Output: Blocks: [10] [25, 30, 40]
+    for name, timings in benchmark_positional_edits(n=1_000_000, edits=1_000).items():
+        print(f"{name:>8}: {timings['inserts']:.3f}s for 1,000 middle inserts, "
+              f"{timings['reads']:.4f}s for 1,000 reads (n = 1,000,000)")
\ No newline at end of file
@@ -1,28 +1,271 @@
+import array
+import cmath
+import collections
+import functools
+import itertools
+import math
+import multiprocessing
+import os
+import time
+from multiprocessing import Pool, resource_tracker, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; filters fall back to the pure-Python loops without it
+    np = None
+
+
+def _fft(values, invert=False):
+    """
+    Iterative radix-2 Cooley-Tukey FFT, used when NumPy is not installed.
+
+    Args:
+        values (list[complex]): The samples. The length must be a power of two.
+        invert (bool): Whether to compute the inverse transform (including the 1/n scaling).
+
+    Returns:
+        list[complex]: The transformed samples.
+
+    Time Complexity: O(n log n).
+    """
+    n = len(values)
+    spectrum = list(values)
+    j = 0
+    for i in range(1, n):  # Reorder the samples into bit-reversed index order
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j ^= bit
+        if i < j:
+            spectrum[i], spectrum[j] = spectrum[j], spectrum[i]
+    sign = 1 if invert else -1
+    length = 2
+    while length <= n:
+        half = length // 2
+        twiddles = [cmath.exp(sign * 2j * math.pi * k / length) for k in range(half)]
+        for start in range(0, n, length):
+            for k in range(half):
+                even = spectrum[start + k]
+                odd = spectrum[start + k + half] * twiddles[k]
+                spectrum[start + k] = even + odd
+                spectrum[start + k + half] = even - odd
+        length <<= 1
+    if invert:
+        spectrum = [value / n for value in spectrum]
+    return spectrum
+
+
+def _fft2(matrix, invert=False):
+    """
+    2-D FFT of a matrix whose dimensions are powers of two: a 1-D FFT of every row, then of every column.
+    """
+    rows = [_fft(row, invert) for row in matrix]
+    columns = [_fft(column, invert) for column in zip(*rows)]
+    return [list(row) for row in zip(*columns)]
+
+
+def _attach_shared_block(name):
+    """
+    Attaches a pool worker to one of apply_filter()'s shared blocks, leaving the unlinking to
+    the process that created it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 registers every attached block with a resource tracker
+        block = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None:  # An own tracker would unlink it at exit
+            resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _write_rows(block, pixels, cols, row_start, rows):
+    """
+    Stores image rows in a shared block laid out as `pixels` doubles followed by `pixels` flag
+    bytes. A flag of 1 marks a pixel that was a Python int, so _read_rows() restores the exact
+    int/float mix that the filters produce (clamped pixels are ints, in-range float results floats).
+
+    Args:
+        block (SharedMemory): A block of at least 9 * pixels bytes.
+        pixels (int): Number of pixels in the whole image.
+        cols (int): Number of columns in the image.
+        row_start (int): Index of the first row to write.
+        rows (list[list[int]]): The rows to write.
+    """
+    with block.buf[:8 * pixels].cast('d') as values, block.buf[8 * pixels:9 * pixels] as flags:
+        for offset, row in enumerate(rows):
+            start = (row_start + offset) * cols
+            values[start:start + cols] = array.array('d', row)
+            flags[start:start + cols] = bytes(isinstance(value, int) for value in row)
+
+
+def _read_rows(block, pixels, cols, indices):
+    """
+    Reads the rows with the given indices, written by _write_rows(), back into a list of lists.
+    An index of None reads as a row of zeros (a zero-padding row).
+    """
+    with block.buf[:8 * pixels].cast('d') as values, block.buf[8 * pixels:9 * pixels] as flags:
+        rows = []
+        for row in indices:
+            if row is None:
+                rows.append([0] * cols)
+                continue
+            start = row * cols
+            row_flags = bytes(flags[start:start + cols])
+            rows.append([int(value) if flag else value
+                         for value, flag in zip(values[start:start + cols].tolist(), row_flags)])
+        return rows
+
+
+def _filter_band(task):
+    """
+    Pool worker for ImagePixelProcessor.apply_filter(workers=N): filters one band of rows.
+
+    The worker reads the padded rows that the band's kernel windows reach, as listed by the
+    whole image's row padding map, so rows beyond the image edge are already padded (or wrapped,
+    or reflected) exactly as for the whole image. The band processor then only pads the columns,
+    and its output rows pad to pad + band rows - 1 are the band's rows, computed with the same
+    arithmetic as the serial path.
+
+    Args:
+        task (tuple): (source name, target name, rows, cols, band start, band stop, row indices,
+            kernel, padding type, backend, pad, separable, fft).
+    """
+    (source_name, target_name, rows, cols, start, stop, indices,
+     kernel, padding_type, backend, pad, separable, fft) = task
+    source, target = _attach_shared_block(source_name), _attach_shared_block(target_name)
+    try:
+        band = ImagePixelProcessor(_read_rows(source, rows * cols, cols, indices), padding_type, backend)
+        output = band.apply_filter(kernel, pad, separable=separable, fft=fft, workers=1)
+        _write_rows(target, rows * cols, cols, start, output[pad:pad + stop - start])
+    finally:
+        source.close()
+        target.close()
+
+
 class ImagePixelProcessor:
     """
     A flexible image processor that supports various kernel-based image filters and transformations. 
     This processor allows customized padding, filter sizes, and a variety of filters such as blur, sharpen, 
     edge detection, emboss, and custom user-defined filters. It also supports basic image transformations.
+
+    Pixels beyond the image edge come from the padding type: 'zero' (0), 'replicate' (the nearest
+    edge pixel), 'reflect' (mirrored about the edge pixel, d c b | a b c d | c b a) or 'wrap' (the
+    opposite edge, as if the image tiled the plane). The Python paths pad virtually: they read
+    interior pixels straight from the image and map only the border windows' indices, so no
+    padded copy of the image is built.
+
+    Filters run on one of two backends:
+    - 'python': nested loops over the image, O(k_rows * k_cols) Python operations per pixel.
+    - 'numpy': one vectorized multiply-add of a shifted slice of the padded image per kernel weight,
+      so the per-pixel work happens in C. The weights are added in the same order as the loops,
+      so both backends return identical values.
+    The default 'auto' uses NumPy when it is installed.
+
+    Rank-1 kernels (box blur, Gaussian, Sobel, ...) are detected and applied as a row pass followed
+    by a column pass, which costs k_rows + k_cols multiply-adds per pixel instead of k_rows * k_cols.
+
+    blur() and region_sum() use an integral image (summed-area table), built once and cached until
+    the image is replaced, so box sums cost O(1) per pixel for any kernel size.
+
+    apply_filter(workers=N) splits the image into N row bands and filters them in a process pool,
+    sharing the input and output pixels through shared memory (see benchmark_workers()).
+
+    stream_filter() filters rows as they arrive from an iterator or a text file, holding only
+    O(k_rows + pad) padded rows at a time, for images that do not fit in memory.
+
+    pipeline() records a chain of filters and flips and evaluates it once (see FilterPipeline).
+
+    Other kernels at least FFT_KERNEL_THRESHOLD[backend] wide or tall, such as large float PSFs,
+    are applied with an FFT, whose cost barely depends on the kernel size (see
+    benchmark_fft_threshold()). Integer kernels on integer images are rounded back to exact
+    results, so both backends still agree. Float results differ from the direct sum by about
+    1e-12 of the pixel range, and so can differ by as much between the backends, whose
+    thresholds differ; pass fft=False to keep the direct sum.
     """
     
-    def __init__(self, image, padding_type='zero'):
+    BACKENDS = ('auto', 'python', 'numpy')
+    PADDING_TYPES = ('zero', 'replicate', 'reflect', 'wrap')
+    KERNELS = {
+        'sharpen': [[0, -1, 0], [-1, 5, -1], [0, -1, 0]],  # Sharpen kernel
+        'edge_detection': [[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]],  # Edge detection kernel
+        'emboss': [[-2, -1, 0], [-1, 1, 1], [0, 1, 2]],  # Emboss kernel
+        'sharpen_highpass': [[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]],  # High-pass filter kernel
+    }
+    # Smallest kernel side for which the FFT beat the direct sum in benchmark_fft_threshold()
+    # (python: 120x160 image, numpy: 480x640 and 1080x1920 images)
+    FFT_KERNEL_THRESHOLD = {'python': 21, 'numpy': 7}
+
+    def __init__(self, image, padding_type='zero', backend='auto', workers=1):
         """
         Initializes the processor with the given image and padding configuration.
 
         Args:
             image (list[list[int]]): 2D array representing a grayscale image.
-            padding_type (str): The type of padding to apply ('zero' or 'replicate'). Default is 'zero'.
+            padding_type (str): The type of padding to apply ('zero', 'replicate', 'reflect' or
+                'wrap'). Default is 'zero'.
+            backend (str): The convolution backend ('auto', 'python' or 'numpy'). Default is 'auto'.
+            workers (int): Number of processes used by apply_filter(). Default is 1 (serial).
         """
-        self.image = image
-        self.padding_type = padding_type  # Define padding type ('zero' or 'replicate')
+        self.image = image  # Also resets the cached integral image
+        self.padding_type = padding_type  # Define padding type ('zero', 'replicate', 'reflect' or 'wrap')
+        self.backend = backend
+        self.workers = workers
 
-    def apply_filter(self, kernel, padding=None):
+    @property
+    def image(self):
+        """
+        The 2D array being processed. Assigning a new image discards the cached integral image.
+        """
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        self._image = image
+        self._integral = None  # (backend, table) built by integral_image()
+
+    def invalidate_cache(self):
+        """
+        Discards the cached integral image. Call this after editing pixels of self.image in place,
+        which the processor cannot detect. Assigning a new image invalidates the cache automatically.
+        """
+        self._integral = None
+
+    def _resolve_backend(self, backend):
+        """
+        Turns a backend name (or None for the processor's default) into 'python' or 'numpy'.
+
+        Raises:
+            ValueError: If the backend name is unknown.
+            ImportError: If 'numpy' is requested but NumPy is not installed.
+        """
+        backend = backend if backend is not None else self.backend
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend {backend!r}. Use one of {self.BACKENDS}.")
+        if backend == 'auto':
+            return 'numpy' if np is not None else 'python'
+        if backend == 'numpy' and np is None:
+            raise ImportError("The 'numpy' backend requires NumPy. Install it with 'pip install numpy'.")
+        return backend
+
+    def apply_filter(self, kernel, padding=None, backend=None, separable=True, fft=None, workers=None):
         """
         Applies a given kernel to the image using convolution with customizable padding.
 
         Args:
             kernel (list[list[int]]): 2D array representing the kernel.
             padding (int, optional): The padding size to be added around the image. Defaults to None.
+            backend (str, optional): 'auto', 'python' or 'numpy'. Defaults to the processor's backend.
+            separable (bool): Whether to run rank-1 kernels as two 1-D passes. Default is True.
+                Float results may then differ from the 2-D sum in the last bit, since the products
+                are added in a different order.
+            fft (bool, optional): Whether to convolve through an FFT. Default is None, which uses
+                the FFT for non-separable kernels of at least FFT_KERNEL_THRESHOLD pixels per side.
+                Integer kernels on integer images give exact results; float results differ from
+                the direct sum by about 1e-12 of the pixel range.
+            workers (int, optional): Number of processes to split the rows across. Defaults to the
+                processor's workers. The output matches the serial path, except that float kernels
+                on the FFT path may differ in the last bits, since each band has its own transform.
 
         Returns:
             list[list[int]]: The filtered image as a 2D array after applying the kernel.
@@ -31,29 +274,106 @@ class ImagePixelProcessor:
         k_rows, k_cols = len(kernel), len(kernel[0])
         pad = padding if padding is not None else k_rows // 2  # Padding size
 
-        # Create a padded version of the image based on the selected padding type
-        padded_image = self._apply_padding(self.image, rows, cols, k_rows, k_cols, pad)
+        workers = workers if workers is not None else self.workers
+        if workers > 1 and rows > 1:
+            return self._apply_filter_parallel(kernel, pad, self._resolve_backend(backend), separable, fft, workers)
+
+        factors = self._separate(kernel) if separable else None
+        if factors is not None:
+            row_kernel, col_kernel = factors
+            return self.apply_separable_filter(row_kernel, col_kernel, padding=pad, backend=backend)
+
+        backend = self._resolve_backend(backend)
+        if fft is None:
+            fft = max(k_rows, k_cols) >= self.FFT_KERNEL_THRESHOLD[backend]
+        if fft:
+            return self._apply_filter_fft(kernel, rows, cols, k_rows, k_cols, pad, backend)
+
+        if backend == 'numpy':
+            return self._apply_filter_numpy(kernel, rows, cols, k_rows, k_cols, pad)
+
+        # Map the padded image's rows and columns to the image's instead of building a padded copy
+        row_map, col_map = self._apply_padding(rows, cols, pad)
+        image = self.image
 
         # Prepare an output image
         output = [[0] * cols for _ in range(rows)]
 
         # Perform convolution
         for i in range(rows):
+            # Image rows under the window, or None if some of them lie in the padding
+            window_rows = image[i - pad:i - pad + k_rows] if pad <= i <= rows - k_rows + pad else None
             for j in range(cols):
                 result = 0
-                for ki in range(k_rows):
-                    for kj in range(k_cols):
-                        result += padded_image[i + ki][j + kj] * kernel[ki][kj]
+                if window_rows is not None and pad <= j <= cols - k_cols + pad:
+                    # Interior pixel: read the window straight from the image
+                    first = j - pad
+                    for image_row, kernel_row in zip(window_rows, kernel):
+                        for kj in range(k_cols):
+                            result += image_row[first + kj] * kernel_row[kj]
+                else:
+                    # Border pixel: look the window up through the padding maps
+                    for ki in range(k_rows):
+                        source_row, kernel_row = row_map[i + ki], kernel[ki]
+                        for kj in range(k_cols):
+                            source_col = col_map[j + kj]
+                            value = 0 if source_row is None or source_col is None else image[source_row][source_col]
+                            result += value * kernel_row[kj]
                 output[i][j] = min(max(result, 0), 255)  # Clamp to [0, 255]
         
         return output
 
-    def _apply_padding(self, image, rows, cols, k_rows, k_cols, pad):
+    def _apply_filter_parallel(self, kernel, pad, backend, separable, fft, workers):
         """
-        Applies the padding to the image, either using zero-padding or replicate-padding.
-        
+        Filters the image in `workers` row bands in a process pool and stitches the bands together.
+
+        The image is copied once into a shared memory block, which every worker reads its band
+        and halo from, and the workers write their rows straight into a shared output block, so
+        no pixels are pickled. Band b covers rows [b * rows // workers, (b + 1) * rows // workers),
+        and its halo adds the padded rows its kernel windows reach above and below.
+
         Args:
-            image (list[list[int]]): Original 2D image.
+            kernel (list[list[int]]): 2D array representing the kernel.
+            pad (int): Padding size.
+            backend (str): The resolved backend ('python' or 'numpy').
+            separable (bool): Passed through to apply_filter() in each worker.
+            fft (bool | None): Passed through to apply_filter() in each worker.
+            workers (int): Number of processes.
+
+        Returns:
+            list[list[int]]: The filtered image as a 2D array.
+        """
+        rows, cols = len(self.image), len(self.image[0])
+        k_rows, pixels = len(kernel), rows * cols
+        bands = min(workers, rows)
+        bounds = [rows * band // bands for band in range(bands + 1)]
+        source = shared_memory.SharedMemory(create=True, size=9 * pixels)
+        target = shared_memory.SharedMemory(create=True, size=9 * pixels)
+        try:
+            _write_rows(source, pixels, cols, 0, self.image)
+            row_map, _ = self._apply_padding(rows, cols, pad)
+            tasks = []
+            for start, stop in zip(bounds, bounds[1:]):
+                # The band's rows and halo, padded; at least pad rows past the band so that the
+                # worker's output rows pad to pad + band rows - 1 exist
+                indices = row_map[start:stop + max(k_rows - 1, pad)]
+                tasks.append((source.name, target.name, rows, cols, start, stop, indices,
+                              kernel, self.padding_type, backend, pad, separable, fft))
+            with Pool(workers) as pool:
+                pool.map(_filter_band, tasks)
+            return _read_rows(target, pixels, cols, range(rows))
+        finally:
+            for block in (source, target):
+                block.close()
+                block.unlink()
+
+    def _apply_filter_numpy(self, kernel, rows, cols, k_rows, k_cols, pad):
+        """
+        Vectorized convolution: for each kernel weight, adds the weighted slice of the padded image
+        that lines up with the output, so each step is one C loop over the whole image.
+
+        Args:
+            kernel (list[list[int]]): 2D array representing the kernel.
             rows (int): Number of rows in the image.
             cols (int): Number of columns in the image.
             k_rows (int): Kernel rows.
@@ -61,28 +381,409 @@ class ImagePixelProcessor:
             pad (int): Padding size.
 
         Returns:
-            list[list[int]]: Padded 2D image.
+            list[list[int]]: The filtered image, equal element for element to the 'python' backend.
         """
-        if self.padding_type == 'zero':
-            # Zero padding: Add 0s around the image
-            padded_image = [[0] * (cols + 2 * pad) for _ in range(rows + 2 * pad)]
-        elif self.padding_type == 'replicate':
-            # Replicate padding: Repeat the edge pixels
-            padded_image = [[0] * (cols + 2 * pad) for _ in range(rows + 2 * pad)]
-            for i in range(rows):
-                for j in range(cols):
-                    padded_image[i + pad][j + pad] = self.image[i][j]
-            for i in range(pad):
-                for j in range(cols):
-                    padded_image[i][j + pad] = self.image[0][j]  # Replicate top row
-                    padded_image[rows + pad + i][j + pad] = self.image[rows - 1][j]  # Replicate bottom row
-            for i in range(pad):
-                for j in range(rows + 2 * pad):
-                    padded_image[j][i] = padded_image[j][pad]  # Replicate left column
-                    padded_image[j][cols + pad + i] = padded_image[j][cols + pad - 1]  # Replicate right column
+        padded_image = self._pad_numpy(pad)
+        result = 0
+        for ki in range(k_rows):
+            for kj in range(k_cols):
+                # Same accumulation order as the loops, so floating-point sums round identically
+                result = result + padded_image[ki:ki + rows, kj:kj + cols] * kernel[ki][kj]
+        return self._clamp(result)
+
+    def _apply_filter_fft(self, kernel, rows, cols, k_rows, k_cols, pad, backend):
+        """
+        Convolution through the frequency domain: multiplies the spectra of the padded image and
+        of the flipped kernel (apply_filter correlates, which is convolution with a flipped kernel),
+        transforms back and keeps the region where the kernel lies entirely inside the padded image.
+        The transform is circular, but that region never wraps around.
+
+        Integer images filtered with integer kernels are rounded back to exact integers. Float
+        results carry the FFT's rounding error, around 1e-12 of the pixel range.
+
+        Args:
+            kernel (list[list[int]]): 2D array representing the kernel.
+            rows (int): Number of rows in the image.
+            cols (int): Number of columns in the image.
+            k_rows (int): Kernel rows.
+            k_cols (int): Kernel columns.
+            pad (int): Padding size.
+            backend (str): 'python' (radix-2 FFT on power-of-two sizes) or 'numpy' (numpy.fft).
+
+        Returns:
+            list[list[int]]: The filtered image as a 2D array.
+
+        Time Complexity: O(P log P) for P padded pixels, independent of the kernel size.
+        """
+        if backend == 'numpy':
+            padded_image = self._pad_numpy(pad)
+            flipped = np.asarray(kernel)[::-1, ::-1]
+            spectrum = np.fft.rfft2(padded_image) * np.fft.rfft2(flipped, padded_image.shape)
+            result = np.fft.irfft2(spectrum, padded_image.shape)[k_rows - 1:k_rows - 1 + rows, k_cols - 1:k_cols - 1 + cols]
+            if padded_image.dtype.kind in 'biu' and np.asarray(kernel).dtype.kind in 'biu':
+                result = np.rint(result).astype(np.int64)
+            return self._clamp(result)
+
+        row_map, col_map = self._apply_padding(rows, cols, pad)
+        padded_image = [self._padded_row(None if index is None else self.image[index], col_map)
+                        for index in row_map]  # The transform needs every padded pixel
+        n_rows = 1 << (len(padded_image) - 1).bit_length()  # Next power of two
+        n_cols = 1 << (len(padded_image[0]) - 1).bit_length()
+        image_grid = [row + [0] * (n_cols - len(row)) for row in padded_image]
+        image_grid += [[0] * n_cols for _ in range(n_rows - len(image_grid))]
+        kernel_grid = [[0] * n_cols for _ in range(n_rows)]
+        for ki in range(k_rows):
+            for kj in range(k_cols):
+                kernel_grid[ki][kj] = kernel[k_rows - 1 - ki][k_cols - 1 - kj]
+        image_spectrum, kernel_spectrum = _fft2(image_grid), _fft2(kernel_grid)
+        product = [[a * b for a, b in zip(image_row, kernel_row)]
+                   for image_row, kernel_row in zip(image_spectrum, kernel_spectrum)]
+        full = _fft2(product, invert=True)
+        exact = all(isinstance(value, int) for row in padded_image for value in row) and \
+            all(isinstance(weight, int) for kernel_row in kernel for weight in kernel_row)
+
+        output = [[0] * cols for _ in range(rows)]
+        for i in range(rows):
+            for j in range(cols):
+                result = full[i + k_rows - 1][j + k_cols - 1].real
+                if exact:
+                    result = round(result)
+                output[i][j] = min(max(result, 0), 255)  # Clamp to [0, 255]
+        return output
+
+    def stream_filter(self, source, kernel, padding=None, backend=None):
+        """
+        Filters an image row by row, yielding each output row as soon as the rows below it that
+        its kernel window needs have arrived.
+
+        Only a ring buffer of k_rows padded rows, the first pad + 1 rows and the last
+        k_rows + pad + 1 rows (which reflect padding mirrors above and below the image) are kept,
+        so memory is O(cols * (k_rows + pad)) however many rows the source produces. Each row is
+        padded horizontally on arrival, and the top and bottom padding rows are generated from
+        the kept rows. The results equal apply_filter(kernel, padding, separable=False,
+        fft=False) on the whole image.
+
+        Args:
+            source (iterable | str | os.PathLike): The image rows, as an iterable of lists of
+                pixels or of text lines, or the path of a text file with one row of
+                whitespace-separated pixel values per line. Blank lines are skipped.
+            kernel (list[list[int]]): 2D array representing the kernel.
+            padding (int, optional): The padding size. Defaults to k_rows // 2.
+            backend (str, optional): 'auto', 'python' or 'numpy'. Defaults to the processor's backend.
+
+        Yields:
+            list[int]: The filtered rows, in order.
+
+        Raises:
+            ValueError: If the padding type is not supported or the rows have different lengths.
+                'wrap' padding cannot be streamed, since the rows above the first one are the
+                image's last rows.
+
+        Example:
+            for row in processor.stream_filter("scan.txt", kernel):
+                output_file.write(" ".join(map(str, row)) + "\n")
+        """
+        self._check_padding()
+        if self.padding_type == 'wrap':
+            raise ValueError("'wrap' padding cannot be streamed: it needs the last rows before the first.")
+        if isinstance(source, (str, os.PathLike)):
+            with open(source) as file:
+                yield from self.stream_filter(file, kernel, padding, backend)
+            return
+        backend = self._resolve_backend(backend)
+        k_rows, k_cols = len(kernel), len(kernel[0])
+        pad = padding if padding is not None else k_rows // 2
+        window = collections.deque(maxlen=k_rows)  # The last k_rows padded rows
+        pending = collections.deque()  # Computed rows not yet known to lie inside the image (pad >= k_rows)
+        recent = collections.deque(maxlen=k_rows + pad + 1)  # The last padded image rows, for the bottom padding
+        pushed = released = 0
+
+        def parse():
+            count = width = 0
+            for row in source:
+                if isinstance(row, str):
+                    row = [int(value) if value.lstrip('-').isdigit() else float(value) for value in row.split()]
+                    if not row:
+                        continue
+                if count == 0:
+                    width = len(row)
+                elif len(row) != width:
+                    raise ValueError(f"Row {count} has {len(row)} pixels, expected {width}.")
+                count += 1
+                yield row
+
+        def push(padded_row):
+            nonlocal pushed
+            window.append(padded_row)
+            pushed += 1
+            if pushed >= k_rows:  # The window now holds padded rows pushed - k_rows to pushed - 1
+                pending.append(self._filter_window(window, kernel, cols, k_rows, k_cols, backend))
+
+        def edge_row(index, length):
+            """Padded row `index` (relative to the first image row) of an image of `length` rows."""
+            source_row = self._padding_index(index, length)
+            if source_row is None:
+                return [0] * len(col_map)
+            return head[source_row] if source_row < len(head) else recent[source_row - length]
+
+        rows = parse()
+        head = list(itertools.islice(rows, pad + 1))  # The rows that reflect padding mirrors above the image
+        if not head:
+            return
+        cols = len(head[0])
+        _, col_map = self._apply_padding(len(head), cols, pad)
+        head = [self._padded_row(row, col_map) for row in head]
+        # With a full head, the image has more than pad rows, so len(head) stands in for its length
+        for index in range(-pad, 0):
+            push(edge_row(index, len(head)))
+
+        rows_seen = 0
+        for padded_row in itertools.chain(head, (self._padded_row(row, col_map) for row in rows)):
+            recent.append(padded_row)
+            push(padded_row)
+            rows_seen += 1
+            while pending and released < rows_seen:
+                released += 1
+                yield pending.popleft()
+
+        index = rows_seen
+        while released + len(pending) < rows_seen:  # Bottom padding until every row is computed
+            push(edge_row(index, rows_seen))
+            index += 1
+        while released < rows_seen:
+            released += 1
+            yield pending.popleft()
+
+    def _filter_window(self, window, kernel, cols, k_rows, k_cols, backend):
+        """
+        Computes one output row of stream_filter() from the k_rows padded rows in the window,
+        adding the products in the same order as apply_filter().
+
+        Returns:
+            list[int]: The clamped output row.
+        """
+        padded_rows = list(window)
+        if backend == 'numpy':
+            padded_rows = np.asarray(padded_rows)
+            result = 0
+            for ki in range(k_rows):
+                for kj in range(k_cols):
+                    result = result + padded_rows[ki, kj:kj + cols] * kernel[ki][kj]
+            return self._clamp(result)
+
+        output = [0] * cols
+        for j in range(cols):
+            result = 0
+            for ki in range(k_rows):
+                padded_row, kernel_row = padded_rows[ki], kernel[ki]
+                for kj in range(k_cols):
+                    result += padded_row[j + kj] * kernel_row[kj]
+            output[j] = min(max(result, 0), 255)  # Clamp to [0, 255]
+        return output
+
+    def _pad_numpy(self, pad):
+        """
+        Returns the image as a NumPy array padded by `pad` pixels on every side. NumPy's
+        vectorized slices need the padded pixels in memory, and np.pad builds them in C.
+
+        Raises:
+            ValueError: If the padding type is not supported.
+        """
+        self._check_padding()
+        modes = {'zero': 'constant', 'replicate': 'edge', 'reflect': 'reflect', 'wrap': 'wrap'}
+        return np.pad(np.asarray(self.image), pad, mode=modes[self.padding_type])
+
+    @staticmethod
+    def _separate(kernel):
+        """
+        Splits a rank-1 kernel into 1-D factors with kernel[i][j] == col_kernel[i] * row_kernel[j].
+
+        Integer kernels are split exactly into integer factors, so their results stay integers.
+        Float kernels are split around their largest weight and accepted if every weight is
+        reproduced to within 1e-12 of the largest one.
+
+        Args:
+            kernel (list[list[int]]): 2D array representing the kernel.
+
+        Returns:
+            tuple | None: (row_kernel, col_kernel), or None if the kernel is not separable, is
+            all zeros, or has a single row or column (where splitting would not save work).
+        """
+        k_rows, k_cols = len(kernel), len(kernel[0])
+        if k_rows < 2 or k_cols < 2:
+            return None
+        pivot_row = max(range(k_rows), key=lambda i: max(abs(weight) for weight in kernel[i]))
+        largest = max(abs(weight) for weight in kernel[pivot_row])
+        if largest == 0:
+            return None
+        row_kernel = list(kernel[pivot_row])
+        if all(isinstance(weight, int) for kernel_row in kernel for weight in kernel_row):
+            divisor = functools.reduce(math.gcd, row_kernel)
+            row_kernel = [weight // divisor for weight in row_kernel]
+            pivot_col = max(range(k_cols), key=lambda j: abs(row_kernel[j]))
+            col_kernel = [kernel[i][pivot_col] // row_kernel[pivot_col] for i in range(k_rows)]
+            tolerance = 0
         else:
-            raise ValueError("Unsupported padding type. Use 'zero' or 'replicate'.")
-        return padded_image
+            pivot_col = max(range(k_cols), key=lambda j: abs(row_kernel[j]))
+            col_kernel = [kernel[i][pivot_col] / row_kernel[pivot_col] for i in range(k_rows)]
+            tolerance = 1e-12 * largest
+        for i in range(k_rows):
+            for j in range(k_cols):
+                if abs(kernel[i][j] - col_kernel[i] * row_kernel[j]) > tolerance:
+                    return None
+        return row_kernel, col_kernel
+
+    def apply_separable_filter(self, row_kernel, col_kernel, padding=None, backend=None):
+        """
+        Applies the kernel col_kernel x row_kernel as a horizontal pass with row_kernel followed by
+        a vertical pass with col_kernel. Only the final result is clamped.
+
+        Args:
+            row_kernel (list[int]): The 1-D kernel applied along each row (k_cols weights).
+            col_kernel (list[int]): The 1-D kernel applied along each column (k_rows weights).
+            padding (int, optional): The padding size to be added around the image. Defaults to
+                len(col_kernel) // 2, as for the equivalent 2-D kernel.
+            backend (str, optional): 'auto', 'python' or 'numpy'. Defaults to the processor's backend.
+
+        Returns:
+            list[list[int]]: The filtered image as a 2D array.
+
+        Example:
+            processor.apply_separable_filter([1, 2, 1], [1, 2, 1])  # Same as [[1, 2, 1], [2, 4, 2], [1, 2, 1]]
+
+        Time Complexity: O(rows * cols * (k_rows + k_cols)).
+        """
+        rows, cols = len(self.image), len(self.image[0])
+        k_rows, k_cols = len(col_kernel), len(row_kernel)
+        pad = padding if padding is not None else k_rows // 2
+        band = rows + k_rows - 1  # Padded rows the vertical pass reads
+
+        if self._resolve_backend(backend) == 'numpy':
+            padded_image = self._pad_numpy(pad)
+            horizontal = 0
+            for kj in range(k_cols):
+                horizontal = horizontal + padded_image[:band, kj:kj + cols] * row_kernel[kj]
+            result = 0
+            for ki in range(k_rows):
+                result = result + horizontal[ki:ki + rows] * col_kernel[ki]
+            return self._clamp(result)
+
+        row_map, col_map = self._apply_padding(rows, cols, pad)
+        passes = {}  # Horizontal pass of each image row (None: a zero row), shared by the padded rows that repeat it
+        horizontal = []
+        for i in range(band):
+            index = row_map[i]
+            if index not in passes:
+                source = self.image[index] if index is not None else [0] * cols
+                passed = [0] * cols
+                for j in range(cols):
+                    result = 0
+                    if pad <= j <= cols - k_cols + pad:  # Interior: read the row directly
+                        for kj in range(k_cols):
+                            result += source[j - pad + kj] * row_kernel[kj]
+                    else:
+                        for kj in range(k_cols):
+                            source_col = col_map[j + kj]
+                            result += (0 if source_col is None else source[source_col]) * row_kernel[kj]
+                    passed[j] = result
+                passes[index] = passed
+            horizontal.append(passes[index])
+
+        output = [[0] * cols for _ in range(rows)]
+        for i in range(rows):
+            for j in range(cols):
+                result = 0
+                for ki in range(k_rows):
+                    result += horizontal[i + ki][j] * col_kernel[ki]
+                output[i][j] = min(max(result, 0), 255)  # Clamp to [0, 255]
+        return output
+
+    @staticmethod
+    def _clamp(result):
+        """
+        Clamps a NumPy result to [0, 255] and converts it to a list of lists, matching the Python
+        types of min(max(value, 0), 255): out-of-range pixels become the ints 0 and 255, while
+        in-range float results stay floats.
+        """
+        if result.dtype.kind != 'f':
+            return np.clip(result, 0, 255).tolist()
+        output = result.astype(object)
+        output[result < 0] = 0
+        output[result > 255] = 255
+        return output.tolist()
+
+    def _check_padding(self):
+        """
+        Raises:
+            ValueError: If the processor's padding type is not one of PADDING_TYPES.
+        """
+        if self.padding_type not in self.PADDING_TYPES:
+            raise ValueError("Unsupported padding type. Use 'zero', 'replicate', 'reflect' or 'wrap'.")
+
+    def _padding_index(self, index, length):
+        """
+        Maps a position along one axis of the padded image to the image position it reads.
+
+        Positions inside the image map to themselves. Outside it, 'zero' gives None (a 0 pixel),
+        'replicate' clamps to the nearest edge, 'reflect' mirrors about the edge pixel without
+        repeating it (like numpy.pad(mode='reflect'), bouncing back and forth for pads longer than
+        the image) and 'wrap' continues from the opposite edge.
+
+        Args:
+            index (int): The position, relative to the first image pixel (negative before it).
+            length (int): Number of pixels along the axis.
+
+        Returns:
+            int | None: The image position, or None for a zero-padding pixel.
+        """
+        if 0 <= index < length:
+            return index
+        if self.padding_type == 'zero':
+            return None
+        if self.padding_type == 'replicate':
+            return min(max(index, 0), length - 1)
+        if self.padding_type == 'reflect':
+            if length == 1:
+                return 0
+            period = 2 * (length - 1)
+            index %= period
+            return index if index < length else period - index
+        if self.padding_type == 'wrap':
+            return index % length
+        self._check_padding()
+
+    def _apply_padding(self, rows, cols, pad):
+        """
+        Pads the image virtually. Instead of a padded copy, returns maps from the padded image's
+        rows and columns to the image's, so padded[p][q] is image[row_map[p]][col_map[q]], or 0
+        where either map gives None (zero padding).
+
+        Args:
+            rows (int): Number of rows in the image.
+            cols (int): Number of columns in the image.
+            pad (int): Padding size.
+
+        Returns:
+            tuple[list, list]: (row_map, col_map), with rows + 2 * pad and cols + 2 * pad entries.
+
+        Raises:
+            ValueError: If the padding type is not supported.
+
+        Time Complexity: O(rows + cols), where a padded copy costs O(rows * cols).
+        """
+        self._check_padding()
+        row_map = [self._padding_index(p - pad, rows) for p in range(rows + 2 * pad)]
+        col_map = [self._padding_index(q - pad, cols) for q in range(cols + 2 * pad)]
+        return row_map, col_map
+
+    @staticmethod
+    def _padded_row(row, col_map):
+        """
+        Returns one row of the padded image: `row` read through col_map, or zeros if row is None.
+        """
+        if row is None:
+            return [0] * len(col_map)
+        return [0 if col is None else row[col] for col in col_map]
 
     def print_image(self, image):
         """
@@ -94,18 +795,185 @@ class ImagePixelProcessor:
         for row in image:
             print(" ".join(f"{val:3}" for val in row))
 
-    def blur(self, kernel_size=3):
+    def blur(self, kernel_size=3, backend=None):
         """
         Applies a blur filter to the image with customizable kernel size.
 
+        Each output pixel is the mean of its kernel_size x kernel_size window, read from the cached
+        integral image with the same padding semantics as apply_filter().
+
         Args:
             kernel_size (int): Size of the blur kernel. Default is 3 for a 3x3 kernel.
+            backend (str, optional): 'auto', 'python' or 'numpy'. Defaults to the processor's backend.
 
         Returns:
             list[list[int]]: The blurred image as a 2D array.
+
+        Time Complexity: O(rows * cols), independent of kernel_size.
         """
-        blur_kernel = [[1/(kernel_size**2)] * kernel_size for _ in range(kernel_size)]
-        return self.apply_filter(blur_kernel)
+        backend = self._resolve_backend(backend)
+        table = self.integral_image(backend)
+        rows, cols = len(self.image), len(self.image[0])
+        pad, area = kernel_size // 2, kernel_size * kernel_size
+
+        if backend == 'numpy':
+            row_parts = self._window_parts_numpy(rows, kernel_size, pad)
+            col_parts = self._window_parts_numpy(cols, kernel_size, pad)
+            result = 0
+            for row_weight, row_start, row_stop in row_parts:
+                strip = table[row_stop] - table[row_start]  # Column prefix sums of each window's rows
+                for col_weight, col_start, col_stop in col_parts:
+                    box = strip[:, col_stop] - strip[:, col_start]
+                    result = result + np.outer(row_weight, col_weight) * box
+            return self._clamp(result / area)
+
+        row_parts = self._window_parts(rows, kernel_size, pad)
+        col_parts = self._window_parts(cols, kernel_size, pad)
+        output = [[0] * cols for _ in range(rows)]
+        for i in range(rows):
+            for j in range(cols):
+                result = 0
+                for row_weight, row_start, row_stop in row_parts[i]:
+                    start_row, stop_row = table[row_start], table[row_stop]
+                    for col_weight, col_start, col_stop in col_parts[j]:
+                        box = (stop_row[col_stop] - start_row[col_stop]) - (stop_row[col_start] - start_row[col_start])
+                        result += row_weight * col_weight * box
+                output[i][j] = min(max(result / area, 0), 255)  # Clamp to [0, 255]
+        return output
+
+    def integral_image(self, backend=None):
+        """
+        Returns the integral image (summed-area table) of the image, building it on first use.
+
+        table[i][j] is the sum of all pixels above and to the left of (i, j), exclusive, so the
+        table has one more row and column than the image and the sum of any rectangle needs four
+        lookups. The table is cached until the image is replaced or invalidate_cache() is called.
+
+        Args:
+            backend (str, optional): 'auto', 'python' or 'numpy'. Defaults to the processor's backend.
+
+        Returns:
+            list[list[int]] | numpy.ndarray: The (rows + 1) x (cols + 1) table.
+
+        Time Complexity: O(rows * cols) to build, O(1) when cached.
+        """
+        backend = self._resolve_backend(backend)
+        if self._integral is not None and self._integral[0] == backend:
+            return self._integral[1]
+        rows, cols = len(self.image), len(self.image[0])
+
+        if backend == 'numpy':
+            image = np.asarray(self.image)
+            if image.dtype.kind in 'biu':
+                image = image.astype(np.int64)  # Avoid overflowing narrow pixel types
+            table = np.zeros((rows + 1, cols + 1), dtype=image.dtype)
+            table[1:, 1:] = np.cumsum(np.cumsum(image, axis=1), axis=0)
+        else:
+            table = [[0] * (cols + 1) for _ in range(rows + 1)]
+            for i in range(rows):
+                running, above, current = 0, table[i], table[i + 1]
+                for j in range(cols):
+                    running += self.image[i][j]
+                    current[j + 1] = above[j + 1] + running
+        self._integral = (backend, table)
+        return table
+
+    def region_sum(self, r0, c0, r1, c1):
+        """
+        Returns the sum of the pixels in rows r0 to r1 - 1 and columns c0 to c1 - 1 (half-open,
+        like Python slices), using four lookups in the integral image.
+
+        Args:
+            r0 (int): First row of the region.
+            c0 (int): First column of the region.
+            r1 (int): Row just past the region.
+            c1 (int): Column just past the region.
+
+        Returns:
+            int: The sum of the region (a float for float images). Empty regions sum to 0.
+
+        Raises:
+            IndexError: If the region does not lie within the image.
+
+        Time Complexity: O(1) once the integral image is built.
+        """
+        rows, cols = len(self.image), len(self.image[0])
+        if not (0 <= r0 <= r1 <= rows and 0 <= c0 <= c1 <= cols):
+            raise IndexError(f"Region ({r0}, {c0}, {r1}, {c1}) is outside the {rows}x{cols} image.")
+        table = self.integral_image()
+        total = table[r1][c1] - table[r0][c1] - table[r1][c0] + table[r0][c0]
+        return total.item() if np is not None and isinstance(total, np.generic) else total
+
+    def region_mean(self, r0, c0, r1, c1):
+        """
+        Returns the mean pixel value of a region, with the same bounds as region_sum().
+
+        Raises:
+            IndexError: If the region does not lie within the image.
+            ValueError: If the region is empty.
+        """
+        area = (r1 - r0) * (c1 - c0)
+        if area <= 0:
+            raise ValueError("Cannot take the mean of an empty region.")
+        return self.region_sum(r0, c0, r1, c1) / area
+
+    def _window_parts(self, length, size, pad):
+        """
+        Splits the window of every output position along one axis into integral-image ranges.
+
+        The window of output position p covers image positions p - pad to p - pad + size - 1.
+        Its in-image part becomes one (1, start, stop) range. The positions before and after the
+        image are mapped through _padding_index(), and each run of neighbouring pixels read
+        equally often becomes a (count, start, stop) range: replicate padding reads (count, 0, 1)
+        and (count, length - 1, length), while reflect and wrap padding read ranges further in or
+        from the opposite edge. Zero padding adds nothing.
+
+        Args:
+            length (int): Number of pixels along the axis.
+            size (int): Window size along the axis.
+            pad (int): Padding size.
+
+        Returns:
+            list[list[tuple]]: For each position, its (weight, start, stop) ranges in order.
+
+        Raises:
+            ValueError: If the padding type is not supported.
+        """
+        self._check_padding()
+
+        def runs(positions):
+            counts = collections.Counter(self._padding_index(index, length) for index in positions)
+            counts.pop(None, None)
+            ranges = []
+            for index in sorted(counts):
+                if ranges and ranges[-1][0] == counts[index] and ranges[-1][2] == index:
+                    ranges[-1] = (counts[index], ranges[-1][1], index + 1)
+                else:
+                    ranges.append((counts[index], index, index + 1))
+            return ranges
+
+        parts = []
+        for position in range(length):
+            first, stop = position - pad, position - pad + size
+            ranges = runs(range(first, min(stop, 0)))
+            if max(first, 0) < min(stop, length):
+                ranges.append((1, max(first, 0), min(stop, length)))
+            ranges += runs(range(max(first, length), stop))
+            parts.append(ranges)
+        return parts
+
+    def _window_parts_numpy(self, length, size, pad):
+        """
+        _window_parts() as arrays over all positions: slot s holds every position's s-th range,
+        with a weight of 0 and an empty range where a position has fewer ranges.
+        """
+        parts = self._window_parts(length, size, pad)
+        slots = max(len(ranges) for ranges in parts)
+        weights, starts, stops = (np.zeros((slots, length), dtype=np.int64) for _ in range(3))
+        for position, ranges in enumerate(parts):
+            for slot, (weight, start, stop) in enumerate(ranges):
+                weights[slot, position], starts[slot, position], stops[slot, position] = weight, start, stop
+        return list(zip(weights, starts, stops))
 
     def sharpen(self):
         """
@@ -114,7 +982,7 @@ class ImagePixelProcessor:
         Returns:
             list[list[int]]: The sharpened image as a 2D array.
         """
-        sharpen_kernel = [[0, -1, 0], [-1, 5, -1], [0, -1, 0]]  # Sharpen kernel
+        sharpen_kernel = self.KERNELS['sharpen']
         return self.apply_filter(sharpen_kernel)
 
     def edge_detection(self):
@@ -124,7 +992,7 @@ class ImagePixelProcessor:
         Returns:
             list[list[int]]: The edge-detected image as a 2D array.
         """
-        edge_detection_kernel = [[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]]  # Edge detection kernel
+        edge_detection_kernel = self.KERNELS['edge_detection']
         return self.apply_filter(edge_detection_kernel)
 
     def emboss(self):
@@ -134,7 +1002,7 @@ class ImagePixelProcessor:
         Returns:
             list[list[int]]: The embossed image as a 2D array.
         """
-        emboss_kernel = [[-2, -1, 0], [-1, 1, 1], [0, 1, 2]]  # Emboss kernel
+        emboss_kernel = self.KERNELS['emboss']
         return self.apply_filter(emboss_kernel)
 
     def sharpen_highpass(self):
@@ -144,7 +1012,7 @@ class ImagePixelProcessor:
         Returns:
             list[list[int]]: The high-pass sharpened image as a 2D array.
         """
-        highpass_kernel = [[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]  # High-pass filter kernel
+        highpass_kernel = self.KERNELS['sharpen_highpass']
         return self.apply_filter(highpass_kernel)
 
     def custom_filter(self, kernel):
@@ -169,7 +1037,6 @@ class ImagePixelProcessor:
         Returns:
             list[list[int]]: The rotated image as a 2D array.
         """
-        import math
         # Convert angle to radians
         angle_rad = math.radians(angle)
         rows, cols = len(self.image), len(self.image[0])
@@ -185,6 +1052,18 @@ class ImagePixelProcessor:
                     new_image[new_y][new_x] = self.image[i][j]
         return new_image
 
+    def pipeline(self):
+        """
+        Starts a lazy chain of operations on this processor's image.
+
+        Returns:
+            FilterPipeline: An empty pipeline; add steps and call run().
+
+        Example:
+            processor.pipeline().blur(3).sharpen().flip().run()
+        """
+        return FilterPipeline(self)
+
     def flip(self, direction='horizontal'):
         """
         Flips the image either horizontally or vertically.
@@ -211,6 +1090,280 @@ class ImagePixelProcessor:
         
         return flipped_image
 
+def _compose_kernels(first, second):
+    """
+    Returns the single kernel equivalent to correlating with `first` and then with `second`:
+    their full 2-D convolution, of size (r1 + r2 - 1) x (c1 + c2 - 1).
+    """
+    composed = [[0] * (len(first[0]) + len(second[0]) - 1) for _ in range(len(first) + len(second) - 1)]
+    for a, first_row in enumerate(first):
+        for b, first_weight in enumerate(first_row):
+            for c, second_row in enumerate(second):
+                for d, second_weight in enumerate(second_row):
+                    composed[a + c][b + d] += first_weight * second_weight
+    return composed
+
+
+def _centered_kernel(kernel):
+    """
+    Embeds a kernel in a square, odd-sized kernel of zeros whose centre is the pixel apply_filter()
+    aligns with the output (row and column k_rows // 2), so the kernel can be flipped and composed
+    without shifting the image. Square odd kernels are returned unchanged.
+    """
+    k_rows, k_cols = len(kernel), len(kernel[0])
+    pad = k_rows // 2
+    half = max(pad, k_rows - 1 - pad, k_cols - 1 - pad)
+    if k_rows == k_cols == 2 * half + 1:
+        return kernel
+    centered = [[0] * (2 * half + 1) for _ in range(2 * half + 1)]
+    for ki in range(k_rows):
+        for kj in range(k_cols):
+            centered[half - pad + ki][half - pad + kj] = kernel[ki][kj]
+    return centered
+
+
+def _stays_in_range(kernel, low, high):
+    """
+    Checks that correlating pixels in [low, high] with the kernel cannot leave [0, 255], so the
+    clamp after it changes nothing. Float sums get a small margin for rounding.
+    """
+    weights = [weight for kernel_row in kernel for weight in kernel_row]
+    positive = sum(weight for weight in weights if weight > 0)
+    negative = sum(weight for weight in weights if weight < 0)
+    exact = all(isinstance(value, int) for value in weights + [low, high])
+    margin = 0 if exact else 1e-9 * (positive - negative) * max(abs(low), abs(high), 1)
+    lowest = positive * low + negative * high
+    return lowest >= (margin if negative else 0) and positive * high + negative * low <= 255 - margin
+
+
+def _commutes_with_padding(kernel, padding_type):
+    """
+    Checks that padding the filtered image equals filtering the padded image, so a following
+    kernel sees the same border values when the two are composed. Wrap padding always does
+    (circular correlation); reflect padding does for kernels symmetric along both axes.
+    """
+    if padding_type == 'wrap':
+        return True
+    if padding_type == 'reflect':
+        return kernel == kernel[::-1] and all(kernel_row == kernel_row[::-1] for kernel_row in kernel)
+    return False
+
+
+class FilterPipeline:
+    """
+    A lazy chain of ImagePixelProcessor operations, created by processor.pipeline().
+
+    Steps are only recorded until run(). Flips never touch pixels: each one mirrors the kernels
+    recorded after it and flips the final output's index order once at the end. Every padding
+    type is mirror-symmetric (flipping the image flips its padding), so a flip commutes with a
+    centred kernel and this changes nothing. A rotate() is applied to the image evaluated so far.
+
+    Consecutive kernels are composed into one kernel and applied in a single pass only where that
+    gives the same image as applying them in turn: the earlier kernels must provably keep every
+    pixel in [0, 255], so the skipped clamp would not have changed anything, and the padding must
+    commute with them ('wrap' always, 'reflect' for symmetric kernels), so the single padding of
+    the original image matches padding each intermediate one. Otherwise the pipeline builds the
+    intermediate image and starts a new kernel from it. Fused float kernels can differ from the
+    step-by-step result by floating-point rounding (around 1e-12).
+
+    Example:
+        processor.pipeline().blur(3).sharpen().flip().run()
+    """
+
+    def __init__(self, processor):
+        """
+        Initializes an empty pipeline over a processor's image and settings.
+
+        Args:
+            processor (ImagePixelProcessor): The processor whose image, padding type, backend and
+                workers the pipeline uses.
+        """
+        self.processor = processor
+        self.steps = []  # (name, args) in the order they were added
+
+    def _add(self, name, *args):
+        """Records a step and returns the pipeline, so calls can be chained."""
+        self.steps.append((name, args))
+        return self
+
+    def apply_filter(self, kernel):
+        """Records a convolution with an arbitrary kernel."""
+        return self._add('apply_filter', kernel)
+
+    def custom_filter(self, kernel):
+        """Records a convolution with a user-defined kernel."""
+        return self._add('apply_filter', kernel)
+
+    def blur(self, kernel_size=3):
+        """Records a kernel_size x kernel_size box blur."""
+        return self._add('apply_filter', [[1 / (kernel_size ** 2)] * kernel_size for _ in range(kernel_size)])
+
+    def sharpen(self):
+        """Records a sharpen filter."""
+        return self._add('apply_filter', ImagePixelProcessor.KERNELS['sharpen'])
+
+    def edge_detection(self):
+        """Records an edge detection filter."""
+        return self._add('apply_filter', ImagePixelProcessor.KERNELS['edge_detection'])
+
+    def emboss(self):
+        """Records an emboss filter."""
+        return self._add('apply_filter', ImagePixelProcessor.KERNELS['emboss'])
+
+    def sharpen_highpass(self):
+        """Records a high-pass sharpen filter."""
+        return self._add('apply_filter', ImagePixelProcessor.KERNELS['sharpen_highpass'])
+
+    def flip(self, direction='horizontal'):
+        """
+        Records a flip.
+
+        Raises:
+            ValueError: If the direction is not 'horizontal' or 'vertical'.
+        """
+        if direction not in ('horizontal', 'vertical'):
+            raise ValueError("Direction must be 'horizontal' or 'vertical'.")
+        return self._add('flip', direction)
+
+    def rotate(self, angle):
+        """Records a rotation by the given angle (clockwise)."""
+        return self._add('rotate', angle)
+
+    def _processor_for(self, image):
+        """
+        Returns a processor over the image with the pipeline's settings, reusing the original one.
+        """
+        source = self.processor
+        if image is source.image:
+            return source
+        return ImagePixelProcessor(image, source.padding_type, source.backend, source.workers)
+
+    def run(self, fuse=True):
+        """
+        Evaluates the recorded steps.
+
+        Args:
+            fuse (bool): Whether to defer flips and compose the consecutive kernels that can be
+                composed without changing the result. Default is True. With False, every step is
+                applied in turn, exactly like calling the processor methods one after another.
+
+        Returns:
+            list[list[int]]: The resulting image as a 2D array.
+        """
+        image = self.processor.image
+        if not fuse:
+            for name, args in self.steps:
+                image = getattr(self._processor_for(image), name)(*args)
+            return image
+
+        padding_type = self.processor.padding_type
+        kernel, pad, flip_rows, flip_cols, pixel_range = None, 0, False, False, None
+        for name, args in self.steps:
+            if name == 'apply_filter':
+                step = _centered_kernel(args[0])
+                if flip_rows:
+                    step = step[::-1]  # Mirror the kernel into the unflipped frame
+                if flip_cols:
+                    step = [row[::-1] for row in step]
+                if kernel is not None:
+                    if pixel_range is None:
+                        pixel_range = (min(map(min, image)), max(map(max, image)))
+                    if _stays_in_range(kernel, *pixel_range) and _commutes_with_padding(kernel, padding_type):
+                        kernel = _compose_kernels(kernel, step)
+                        pad += len(step) // 2
+                        continue
+                    image = self._processor_for(image).apply_filter(kernel, padding=pad)  # Unflipped frame
+                    pixel_range = None
+                kernel, pad = step, len(step) // 2
+            elif name == 'flip':
+                if args[0] == 'vertical':
+                    flip_rows = not flip_rows
+                else:
+                    flip_cols = not flip_cols
+            else:  # rotate() moves pixels non-linearly, so evaluate everything before it
+                image = self._evaluate(image, kernel, pad, flip_rows, flip_cols)
+                image = self._processor_for(image).rotate(*args)
+                kernel, pad, flip_rows, flip_cols, pixel_range = None, 0, False, False, None
+        return self._evaluate(image, kernel, pad, flip_rows, flip_cols)
+
+    def _evaluate(self, image, kernel, pad, flip_rows, flip_cols):
+        """
+        Applies the composed kernel (if any), then reads the result in flipped index order.
+        """
+        if kernel is not None:
+            image = self._processor_for(image).apply_filter(kernel, padding=pad)
+        elif not (flip_rows or flip_cols):
+            return image
+        rows = image[::-1] if flip_rows else image
+        return [row[::-1] for row in rows] if flip_cols else [list(row) for row in rows]
+
+
+def benchmark_fft_threshold(backend='numpy', image_size=(240, 320), kernel_sizes=(3, 5, 7, 9, 11, 15, 21, 31)):
+    """
+    Times the direct and the FFT convolution of a random image with random (non-separable) float
+    square kernels of increasing size, like the PSFs that apply_filter() switches to the FFT for,
+    and reports the smallest size at which the FFT wins, along with the largest difference between
+    the two results. The values of ImagePixelProcessor.FFT_KERNEL_THRESHOLD come from this benchmark.
+
+    Args:
+        backend (str): The backend to time ('python' or 'numpy'). Default is 'numpy'.
+        image_size (tuple): (rows, cols) of the test image. Default is (240, 320).
+        kernel_sizes (tuple): Kernel sides to try, in increasing order.
+
+    Returns:
+        int | None: The smallest kernel side where the FFT was faster, or None if it never was.
+    """
+    import random
+
+    rows, cols = image_size
+    rng = random.Random(0)
+    image = [[rng.randrange(256) for _ in range(cols)] for _ in range(rows)]
+    processor = ImagePixelProcessor(image, padding_type='replicate', backend=backend)
+    threshold = None
+    for size in kernel_sizes:
+        kernel = [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)]
+        timings, outputs = [], []
+        for fft in (False, True):
+            start = time.perf_counter()
+            outputs.append(processor.apply_filter(kernel, separable=False, fft=fft))
+            timings.append(time.perf_counter() - start)
+        deviation = max(abs(a - b) for direct_row, fft_row in zip(*outputs) for a, b in zip(direct_row, fft_row))
+        print(f"{backend} {rows}x{cols}, {size}x{size} kernel: direct {timings[0]:.3f}s, FFT {timings[1]:.3f}s, "
+              f"max difference {deviation:.1e}")
+        if threshold is None and timings[1] < timings[0]:
+            threshold = size
+    return threshold
+
+def benchmark_workers(worker_counts=(1, 2, 4, 8), image_size=(480, 640), backend='python'):
+    """
+    Times apply_filter() with a non-separable 5x5 kernel for several worker counts and checks
+    that every parallel result matches the serial one.
+
+    Args:
+        worker_counts (tuple): The numbers of processes to try. Default is (1, 2, 4, 8).
+        image_size (tuple): (rows, cols) of the test image. Default is (480, 640).
+        backend (str): The backend each worker uses. Default is 'python'.
+
+    Returns:
+        dict: Seconds taken for each worker count.
+    """
+    import random
+
+    rows, cols = image_size
+    rng = random.Random(0)
+    image = [[rng.randrange(256) for _ in range(cols)] for _ in range(rows)]
+    kernel = [[rng.randint(-2, 2) for _ in range(5)] for _ in range(5)]
+    processor = ImagePixelProcessor(image, padding_type='replicate', backend=backend)
+    serial, timings = None, {}
+    for workers in worker_counts:
+        start = time.perf_counter()
+        output = processor.apply_filter(kernel, separable=False, fft=False, workers=workers)
+        timings[workers] = time.perf_counter() - start
+        serial = output if serial is None else serial
+        print(f"{backend} {rows}x{cols}, {workers} worker(s): {timings[workers]:.3f}s, "
+              f"speedup {timings[worker_counts[0]] / timings[workers]:.2f}x, matches serial: {output == serial}")
+    return timings
+
 # Example Usage
 if __name__ == "__main__":
     # Sample grayscale image (5x5)
@@ -256,3 +1409,57 @@ if __name__ == "__main__":
     rotated_image = processor.rotate(90)
     print("\nRotated Image (90 degrees):")
     processor.print_image(rotated_image)
+
+    # Region statistics from the cached integral image
+    print("\nSum of the central 3x3 region:", processor.region_sum(1, 1, 4, 4))  # Output: 990
+    print("Mean of the top row:", processor.region_mean(0, 0, 1, 5))  # Output: 30.0
+
+    # Explicit separable kernel: vertical Sobel as a row pass and a column pass
+    sobel_image = processor.apply_separable_filter([1, 2, 1], [-1, 0, 1])
+    print("\nSobel (separable) Image:")
+    processor.print_image(sobel_image)
+
+    # Stream rows through the filter without holding the whole image
+    sharpen_kernel = [[0, -1, 0], [-1, 5, -1], [0, -1, 0]]
+    streamed_rows = processor.stream_filter(iter(sample_image), sharpen_kernel)
+    print("\nStreamed sharpen matches apply_filter:", list(streamed_rows) == sharpened_image)  # Output: True
+
+    # Lazy pipeline: flips become an index remap of the output
+    pipeline = processor.pipeline().sharpen().flip('vertical').flip()
+    print("\nPipeline (sharpen, flip vertical, flip horizontal):")
+    processor.print_image(pipeline.run())
+    print("Matches step by step:", pipeline.run() == pipeline.run(fuse=False))  # Output: True
+    # With wrap padding a blur stays in range and commutes with the padding, so blur + sharpen
+    # become one 5x5 kernel applied in one pass
+    wrap_pipeline = ImagePixelProcessor(sample_image, padding_type='wrap').pipeline().blur(3).sharpen()
+    fused, stepwise = wrap_pipeline.run(), wrap_pipeline.run(fuse=False)
+    print("Fused blur + sharpen, first row:", [round(value, 1) for value in fused[0]])
+    print("Matches step by step:", all(abs(a - b) < 1e-9 for row, other in zip(fused, stepwise)
+                                       for a, b in zip(row, other)))  # Output: True
+
+    # Reflect and wrap padding, read through index maps instead of a padded copy of the image
+    print()
+    for padding_type in ImagePixelProcessor.PADDING_TYPES:
+        edge_processor = ImagePixelProcessor(sample_image, padding_type=padding_type)
+        blurred_row = [round(value, 1) for value in edge_processor.blur(3)[0]]
+        print(f"Blur with {padding_type} padding, first row:", blurred_row)
+    # Output (reflect): [43.3, 46.7, 56.7, 66.7, 70.0]
+    # Output (wrap): [93.3, 86.7, 96.7, 106.7, 100.0]
+
+    # Compare the convolution backends on a larger image
+    large_image = [[(i * 7 + j * 13) % 256 for j in range(640)] for i in range(480)]
+    large_processor = ImagePixelProcessor(large_image, padding_type='replicate')
+    results = {}
+    for backend in ['python'] + (['numpy'] if np is not None else []):
+        start = time.perf_counter()
+        results[backend] = large_processor.apply_filter([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], backend=backend)
+        print(f"\nSharpen 640x480 with the {backend} backend: {time.perf_counter() - start:.3f}s")
+    print("Backends agree:", all(result == results['python'] for result in results.values()))  # Output: True
+
+    # Split filtering across processes; the parallel output matches the serial one
+    print()
+    benchmark_workers(worker_counts=(1, 2), image_size=(120, 160))
+
+    # Find where the FFT starts beating the direct sum for non-separable kernels
+    if np is not None:
+        print("\nFFT threshold:", benchmark_fft_threshold('numpy', kernel_sizes=(3, 5, 7, 9, 15, 31)))